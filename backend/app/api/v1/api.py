@@ -3,7 +3,7 @@ API Router v1 for NusaNexus NoFOMO
 """
 
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, bots, strategies, trades, ai, health
+from app.api.v1.endpoints import auth, bots, strategies, trades, ai, health, liveness
 
 api_router = APIRouter()
 
@@ -13,4 +13,5 @@ api_router.include_router(bots.router, prefix="/bots", tags=["bots"])
 api_router.include_router(strategies.router, prefix="/strategies", tags=["strategies"])
 api_router.include_router(trades.router, prefix="/trades", tags=["trades"])
 api_router.include_router(ai.router, prefix="/ai", tags=["ai"])
-api_router.include_router(health.router, prefix="/health", tags=["health"])
\ No newline at end of file
+api_router.include_router(health.router, prefix="/health", tags=["health"])
+api_router.include_router(liveness.router, prefix="/health", tags=["health"])
\ No newline at end of file
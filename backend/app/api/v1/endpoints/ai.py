@@ -2,25 +2,43 @@
 AI strategy generation endpoints for NusaNexus NoFOMO
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from typing import Any, AsyncIterator, Dict, List, Optional
+import hashlib
+import orjson
 import structlog
 
-from app.core.auth import get_current_user
+from app.core.auth import get_current_user, get_owned_bot
+from app.core.cache import TTLCache
 from app.core.database import get_db_client
+from app.core.redis import cache_delete, cache_get, cache_set
 from app.services.ai_service import get_ai_service
 from app.models.ai import (
     AIAnalysisResponse, StrategyGenerationRequest, StrategyOptimizationRequest,
     AIStrategyResponse, AIPerformanceAnalysis, AIMarketAnalysis,
-    AITradeSignal, AIChatRequest, AIChatResponse
+    AITradeSignal, AIChatRequest, AIChatResponse,
+    SignalAnalysisRequest, BacktestAnalysisRequest
 )
 from app.models.common import APIResponse
 from app.models.user import UserResponse
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(__name__).bind(module="ai_endpoints")
 router = APIRouter()
 
+# Read-heavy, slowly changing responses. Supervisor lists live in Redis so a new
+# analysis invalidates them for every worker, not just the one that ran it.
+SUPERVISOR_CACHE_TTL = 30
+models_status_cache = TTLCache(ttl=10, maxsize=1)
+
+
+def _supervisor_cache_key(user_id: str, bot_id: str, analysis_type: Optional[str]) -> str:
+    return f"sup:{user_id}:{bot_id}:{analysis_type or ''}"
+
+# Compiled once; validating the whole list in one call avoids a Python-level loop per row
+_analysis_list_adapter = TypeAdapter(List[AIAnalysisResponse])
+
 
 @router.post("/generate-strategy", response_model=AIStrategyResponse)
 async def generate_strategy(
@@ -30,6 +48,7 @@ async def generate_strategy(
     """
     Generate trading strategy using AI
     """
+    log = logger.bind(user_id=current_user.id, endpoint="generate_strategy")
     try:
         ai_service = get_ai_service()
         
@@ -38,8 +57,8 @@ async def generate_strategy(
         
         return response
         
-    except Exception as e:
-        logger.error("AI strategy generation failed", user_id=current_user.id, error=str(e))
+    except Exception:
+        log.exception("AI strategy generation failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to generate strategy with AI"
@@ -54,12 +73,13 @@ async def optimize_strategy(
     """
     Optimize strategy parameters using AI
     """
+    log = logger.bind(user_id=current_user.id, endpoint="optimize_strategy")
     try:
         ai_service = get_ai_service()
         
         # Verify strategy belongs to user
         db_client = get_db_client()
-        strategy = db_client.get_strategy_by_id(request.strategy_id)
+        strategy = await db_client.get_strategy_by_id(request.strategy_id)
         
         if not strategy:
             raise HTTPException(
@@ -84,8 +104,8 @@ async def optimize_strategy(
         
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error("AI strategy optimization failed", user_id=current_user.id, error=str(e))
+    except Exception:
+        log.exception("AI strategy optimization failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to optimize strategy with AI"
@@ -96,36 +116,66 @@ async def optimize_strategy(
 async def get_supervisor_analysis(
     bot_id: str,
     analysis_type: Optional[str] = None,
-    current_user: UserResponse = Depends(get_current_user)
+    current_user: UserResponse = Depends(get_current_user),
+    bot: Dict[str, Any] = Depends(get_owned_bot)
 ):
     """
     Get AI supervisor analysis for bot
     """
+    log = logger.bind(user_id=current_user.id, endpoint="get_supervisor_analysis")
     try:
-        db_client = get_db_client()
+        cache_key = _supervisor_cache_key(current_user.id, bot_id, analysis_type)
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
         
-        # Verify bot belongs to user
-        bot = db_client.get_bot_by_id(bot_id, current_user.id)
-        if not bot:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Bot not found"
-            )
+        db_client = get_db_client()
         
         # Get AI analyses for the bot
-        # This would need to be implemented in the database client
-        analyses = []
+        rows = [
+            analysis
+            async for analysis in db_client.stream_ai_analyses(bot_id, current_user.id, analysis_type)
+        ]
+        # Validated once, encoded once; cache hits reuse the bytes with no re-serialization
+        body = _analysis_list_adapter.dump_json(_analysis_list_adapter.validate_python(rows))
+        await cache_set(cache_key, body, ttl=SUPERVISOR_CACHE_TTL)
         
-        # Filter by analysis type if specified
-        if analysis_type:
-            analyses = [a for a in analyses if a.get("analysis_type") == analysis_type]
+        return Response(content=body, media_type="application/json")
         
-        return [AIAnalysisResponse(**analysis) for analysis in analyses]
+    except HTTPException:
+        raise
+    except Exception:
+        log.exception("Failed to get supervisor analysis", bot_id=bot_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to fetch supervisor analysis"
+        )
+
+
+@router.get("/supervisor/{bot_id}/stream")
+async def stream_supervisor_analysis(
+    bot_id: str,
+    analysis_type: Optional[str] = None,
+    current_user: UserResponse = Depends(get_current_user),
+    bot: Dict[str, Any] = Depends(get_owned_bot)
+):
+    """
+    Stream AI supervisor analysis for bot as newline-delimited JSON
+    """
+    log = logger.bind(user_id=current_user.id, endpoint="stream_supervisor_analysis")
+    try:
+        db_client = get_db_client()
+        
+        async def ndjson() -> AsyncIterator[bytes]:
+            async for analysis in db_client.stream_ai_analyses(bot_id, current_user.id, analysis_type):
+                yield AIAnalysisResponse(**analysis).model_dump_json().encode() + b"\n"
+        
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
         
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error("Failed to get supervisor analysis", bot_id=bot_id, user_id=current_user.id, error=str(e))
+    except Exception:
+        log.exception("Failed to stream supervisor analysis", bot_id=bot_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch supervisor analysis"
@@ -136,41 +186,42 @@ async def get_supervisor_analysis(
 async def run_supervisor_analysis(
     bot_id: str,
     analysis_type: str,
-    current_user: UserResponse = Depends(get_current_user)
+    current_user: UserResponse = Depends(get_current_user),
+    bot: Dict[str, Any] = Depends(get_owned_bot)
 ):
     """
     Run AI supervisor analysis for bot
     """
+    log = logger.bind(user_id=current_user.id, endpoint="run_supervisor_analysis")
     try:
         ai_service = get_ai_service()
         db_client = get_db_client()
         
-        # Verify bot belongs to user
-        bot = db_client.get_bot_by_id(bot_id, current_user.id)
-        if not bot:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Bot not found"
-            )
-        
-        # Run AI analysis
+        # Run AI analysis (get_owned_bot has already rejected bots the user does not own)
         analysis = await ai_service.run_supervisor_analysis(bot_id, analysis_type)
         
-        # Save analysis to database
+        # Save analysis to database (the insert re-checks ownership in case the bot was deleted meanwhile)
         analysis_data = {
-            "user_id": current_user.id,
-            "bot_id": bot_id,
             "analysis_type": analysis_type,
             "input_data": {"bot_id": bot_id},
             "results": analysis,
             "recommendations": analysis.get("recommendations", []),
             "confidence_score": analysis.get("confidence_score", 0.0),
             "model_used": "supervisor",
-            "processing_time_ms": analysis.get("processing_time_ms", 0),
-            "created_at": datetime.utcnow().isoformat()
+            "processing_time_ms": analysis.get("processing_time_ms", 0)
         }
         
-        created_analysis = db_client.create_ai_analysis(analysis_data)
+        created_analysis = await db_client.create_ai_analysis_if_owned(current_user.id, bot_id, analysis_data)
+        if not created_analysis:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Bot not found"
+            )
+        # Only the unfiltered list and the list filtered to this type gain a row
+        await cache_delete(
+            _supervisor_cache_key(current_user.id, bot_id, None),
+            _supervisor_cache_key(current_user.id, bot_id, analysis_type)
+        )
         
         return APIResponse(
             success=True,
@@ -180,8 +231,8 @@ async def run_supervisor_analysis(
         
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error("Supervisor analysis failed", bot_id=bot_id, user_id=current_user.id, error=str(e))
+    except Exception:
+        log.exception("Supervisor analysis failed", bot_id=bot_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to run supervisor analysis"
@@ -196,6 +247,7 @@ async def get_market_analysis(
     """
     Get AI-powered market analysis
     """
+    log = logger.bind(endpoint="get_market_analysis")
     try:
         ai_service = get_ai_service()
         
@@ -204,8 +256,8 @@ async def get_market_analysis(
         
         return analysis
         
-    except Exception as e:
-        logger.error("Market analysis failed", symbol=symbol, error=str(e))
+    except Exception:
+        log.exception("Market analysis failed", symbol=symbol)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to analyze market"
@@ -214,33 +266,23 @@ async def get_market_analysis(
 
 @router.post("/signal-analysis", response_model=AITradeSignal)
 async def analyze_signal(
-    signal_data: Dict[str, Any],
+    signal_data: SignalAnalysisRequest,
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
     Analyze trading signal with AI
     """
+    log = logger.bind(user_id=current_user.id, endpoint="analyze_signal")
     try:
         ai_service = get_ai_service()
         
-        # Validate required signal data
-        required_fields = ["symbol", "signal_type", "price", "timeframe"]
-        for field in required_fields:
-            if field not in signal_data:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Missing required field: {field}"
-                )
-        
         # Analyze signal
-        analysis = await ai_service.analyze_signal(signal_data)
+        analysis = await ai_service.analyze_signal(signal_data.model_dump())
         
         return analysis
         
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Signal analysis failed", user_id=current_user.id, error=str(e))
+    except Exception:
+        log.exception("Signal analysis failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to analyze signal"
@@ -255,6 +297,7 @@ async def ai_chat(
     """
     AI chat assistant for trading questions
     """
+    log = logger.bind(user_id=current_user.id, endpoint="ai_chat")
     try:
         ai_service = get_ai_service()
         
@@ -263,8 +306,8 @@ async def ai_chat(
         
         return response
         
-    except Exception as e:
-        logger.error("AI chat failed", user_id=current_user.id, error=str(e))
+    except Exception:
+        log.exception("AI chat failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get AI response"
@@ -281,6 +324,7 @@ async def get_performance_analysis(
     """
     Get AI-powered performance analysis
     """
+    log = logger.bind(user_id=current_user.id, endpoint="get_performance_analysis")
     try:
         ai_service = get_ai_service()
         
@@ -288,9 +332,9 @@ async def get_performance_analysis(
         db_client = get_db_client()
         
         if entity_type == "bot":
-            entity = db_client.get_bot_by_id(entity_id, current_user.id)
+            entity = await db_client.get_bot_by_id(entity_id, current_user.id)
         elif entity_type == "strategy":
-            entity = db_client.get_strategy_by_id(entity_id)
+            entity = await db_client.get_strategy_by_id(entity_id)
             if not entity or entity.get("user_id") != current_user.id:
                 entity = None
         else:
@@ -312,8 +356,8 @@ async def get_performance_analysis(
         
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error("Performance analysis failed", entity_id=entity_id, user_id=current_user.id, error=str(e))
+    except Exception:
+        log.exception("Performance analysis failed", entity_id=entity_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to analyze performance"
@@ -321,20 +365,33 @@ async def get_performance_analysis(
 
 
 @router.get("/models/status")
-async def get_ai_models_status():
+async def get_ai_models_status(request: Request):
     """
     Get status of AI models and services
     """
+    log = logger.bind(endpoint="get_ai_models_status")
     try:
-        ai_service = get_ai_service()
-        
-        # Get model status
-        status = await ai_service.get_models_status()
-        
-        return status
-        
-    except Exception as e:
-        logger.error("Failed to get AI models status", error=str(e))
+        cached = models_status_cache.get("status")
+        if cached is None:
+            ai_service = get_ai_service()
+            
+            # Get model status and serialize once per TTL window
+            models_status = await ai_service.get_models_status()
+            body = orjson.dumps(models_status, option=orjson.OPT_SORT_KEYS)
+            etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            cached = (etag, body)
+            models_status_cache.set("status", cached)
+        
+        etag, body = cached
+        headers = {"ETag": etag, "Cache-Control": "max-age=10"}
+        
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        
+        return Response(content=body, media_type="application/json", headers=headers)
+        
+    except Exception:
+        log.exception("Failed to get AI models status")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch AI models status"
@@ -343,26 +400,18 @@ async def get_ai_models_status():
 
 @router.post("/backtest-analysis", response_model=APIResponse)
 async def analyze_backtest(
-    backtest_data: Dict[str, Any],
+    backtest_data: BacktestAnalysisRequest,
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
     Analyze backtest results with AI
     """
+    log = logger.bind(user_id=current_user.id, endpoint="analyze_backtest")
     try:
         ai_service = get_ai_service()
         
-        # Validate backtest data
-        required_fields = ["strategy_name", "trading_pair", "results"]
-        for field in required_fields:
-            if field not in backtest_data:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Missing required field: {field}"
-                )
-        
         # Analyze backtest results
-        analysis = await ai_service.analyze_backtest(backtest_data)
+        analysis = await ai_service.analyze_backtest(backtest_data.model_dump())
         
         return APIResponse(
             success=True,
@@ -370,10 +419,8 @@ async def analyze_backtest(
             data=analysis
         )
         
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Backtest analysis failed", user_id=current_user.id, error=str(e))
+    except Exception:
+        log.exception("Backtest analysis failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to analyze backtest results"
@@ -387,28 +434,27 @@ async def get_ai_usage_stats(
     """
     Get AI usage statistics for current user
     """
+    log = logger.bind(user_id=current_user.id, endpoint="get_ai_usage_stats")
     try:
-        # Get user's AI analyses
-        # This would need to be implemented in the database client
-        analyses = []
+        # Aggregated server-side in a single round-trip
+        db_client = get_db_client()
+        usage = await db_client.get_ai_usage_stats(current_user.id) or {}
         
-        # Calculate usage statistics
-        total_requests = len(analyses)
-        total_tokens = sum(a.get("tokens_used", 0) for a in analyses)
-        successful_requests = len([a for a in analyses if a.get("confidence_score", 0) > 0.7])
+        total_requests = usage.get("total_requests", 0)
+        successful_requests = usage.get("successful_requests", 0)
         
         return {
             "user_id": current_user.id,
             "total_requests": total_requests,
-            "total_tokens_used": total_tokens,
+            "total_tokens_used": usage.get("total_tokens_used", 0),
             "successful_requests": successful_requests,
             "success_rate": (successful_requests / total_requests * 100) if total_requests > 0 else 0.0,
-            "analysis_types": list(set(a.get("analysis_type", "unknown") for a in analyses)),
-            "last_usage": analyses[0].get("created_at") if analyses else None
+            "analysis_types": usage.get("analysis_types", []),
+            "last_usage": usage.get("last_usage")
         }
         
-    except Exception as e:
-        logger.error("Failed to get AI usage stats", user_id=current_user.id, error=str(e))
+    except Exception:
+        log.exception("Failed to get AI usage stats")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch AI usage statistics"
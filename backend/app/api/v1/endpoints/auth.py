@@ -3,8 +3,7 @@ Authentication endpoints for NusaNexus NoFOMO with Supabase Auth
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
-from fastapi.responses import JSONResponse
-from typing import Optional, Dict
+from typing import Optional
 import structlog
 
 from app.core.auth import (
@@ -14,10 +13,11 @@ from app.core.auth import (
     reset_password, update_password, update_user_profile
 )
 from app.core.database import get_db_client
+from app.core.responses import ORJSONResponse
 from app.models.auth import (
     AuthResponse, TokenRefresh,
     PasswordResetRequest, PasswordResetConfirm,
-    UserRegister, UserLogin
+    UserRegister, UserLogin, OAuthCodeExchange
 )
 from app.models.user import UserResponse, UserUpdate, UserProfile, UserStats
 from app.models.common import APIResponse
@@ -75,26 +75,20 @@ async def get_current_user_profile(current_user: UserResponse = Depends(get_curr
     try:
         db_client = get_db_client()
         
-        # Get additional user statistics
-        bots = db_client.get_user_bots(current_user.id)
-        strategies = db_client.get_user_strategies(current_user.id)
+        # Aggregated server-side in a single round-trip
+        row = await db_client.get_user_stats(current_user.id) or {}
         
-        # Calculate statistics
-        total_bots = len(bots)
-        active_bots = len([bot for bot in bots if bot.get("status") == "running"])
-        total_trades = sum(bot.get("total_trades", 0) for bot in bots)
-        total_profit = sum(bot.get("profit", 0.0) for bot in bots)
-        
-        winning_trades = sum(bot.get("winning_trades", 0) for bot in bots)
+        total_trades = int(row.get("total_trades") or 0)
+        winning_trades = int(row.get("winning_trades") or 0)
         win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0.0
         
         stats = UserStats(
-            total_bots=total_bots,
-            active_bots=active_bots,
+            total_bots=int(row.get("total_bots") or 0),
+            active_bots=int(row.get("active_bots") or 0),
             total_trades=total_trades,
-            total_profit=total_profit,
+            total_profit=float(row.get("total_profit") or 0.0),
             win_rate=win_rate,
-            strategies_count=len(strategies)
+            strategies_count=int(row.get("strategies_count") or 0)
         )
         
         profile = UserProfile(
@@ -291,7 +285,7 @@ async def oauth_sign_in(
         
         result = await sign_in_with_oauth(provider, redirect_to)
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -308,21 +302,12 @@ async def oauth_sign_in(
 
 
 @router.post("/oauth/callback", response_model=AuthResponse)
-async def oauth_callback(oauth_data: Dict[str, str]):
+async def oauth_callback(oauth_data: OAuthCodeExchange):
     """
     Handle OAuth callback and exchange code for tokens
     """
     try:
-        code = oauth_data.get("code")
-        code_verifier = oauth_data.get("code_verifier")
-        
-        if not code or not code_verifier:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Missing OAuth code or code_verifier"
-            )
-        
-        result = await exchange_oauth_code(code, code_verifier)
+        result = await exchange_oauth_code(oauth_data.code, oauth_data.code_verifier)
         
         logger.info("OAuth authentication successful")
         return result
@@ -2,25 +2,77 @@
 Bot management endpoints for NusaNexus NoFOMO
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
-from typing import List, Optional
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, PlainSerializer, TypeAdapter
+from typing import Annotated, AsyncIterator, List, Optional, Dict, Any, Union
+from datetime import datetime, timezone
+import asyncio
+import functools
+import orjson
 import structlog
 
-from app.core.auth import get_current_user
+from app.core.auth import get_current_user, get_owned_bot
 from app.core.database import get_db_client
+from app.core.cache import SingleFlight
+from app.core.redis import cache_get, cache_set, bot_status_key
+from app.core.responses import ORJSONResponse
+from app.models.common import ExchangeType, FastModel, TimeFrame
 from app.models.user import UserResponse
+from app.services.bot_status_writer import get_bot_status_writer
 
 logger = structlog.get_logger()
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Seconds a computed /status payload is served from Redis
+BOT_STATUS_CACHE_TTL = 3
+
+# Rows shown in the status "recent_trades" list; nothing else reads trade rows here
+RECENT_TRADES_LIMIT = 10
+# Covered by idx_trades_bot_created_at so the recent-trades read stays index-only
+RECENT_TRADE_COLUMNS = "created_at,profit,side,trading_pair,amount"
+
+_status_flight = SingleFlight()
+
+def handle_endpoint_errors(message: str, detail: Optional[str] = None):
+    """Log unexpected handler errors and turn them into a 500; HTTPExceptions pass through"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                current_user = kwargs.get("current_user")
+                logger.error(
+                    message,
+                    bot_id=kwargs.get("bot_id"),
+                    user_id=getattr(current_user, "id", None),
+                    error=str(e)
+                )
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=detail or message
+                )
+        return wrapper
+    return decorator
+
+
+# PostgREST returns timestamptz columns as ISO-8601 strings, which is already the
+# wire format; rows built with from_row pass them through without parsing
+Timestamp = Annotated[
+    Union[datetime, str],
+    PlainSerializer(lambda v: v if isinstance(v, str) else v.isoformat(), return_type=str)
+]
+
 
 # Pydantic models
 class BotConfig(BaseModel):
     name: str
-    exchange: str  # binance, bybit
+    exchange: ExchangeType
     trading_pair: str
-    timeframe: str  # 1m, 5m, 15m, 1h, 4h, 1d
+    timeframe: TimeFrame
     strategy: str
     initial_balance: float
     max_open_trades: int = 1
@@ -32,7 +84,10 @@ class BotUpdate(BaseModel):
     max_open_trades: Optional[int] = None
     stake_amount: Optional[float] = None
 
-class BotResponse(BaseModel):
+class BotResponse(FastModel):
+    # Built once per row and never mutated
+    model_config = ConfigDict(frozen=True)
+    
     id: str
     user_id: str
     name: str
@@ -47,68 +102,79 @@ class BotResponse(BaseModel):
     winning_trades: int
     losing_trades: int
     profit: float
-    created_at: datetime
-    updated_at: datetime
+    created_at: Timestamp
+    updated_at: Timestamp
+    
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "BotResponse":
+        """Build a response from a bots row without re-validating trusted DB fields"""
+        initial_balance = float(row.get("initial_balance") or 0)
+        profit = float(row.get("profit") or 0)
+        
+        return cls.model_construct(
+            id=row["id"],
+            user_id=row["user_id"],
+            name=row["name"],
+            exchange=row["exchange"],
+            trading_pair=row["trading_pair"],
+            timeframe=row["timeframe"],
+            strategy=row["strategy"],
+            status=row.get("status") or "stopped",
+            initial_balance=initial_balance,
+            # Trade statistics are maintained on the bot row by the trades trigger
+            current_balance=initial_balance + profit,
+            total_trades=row.get("total_trades") or 0,
+            winning_trades=row.get("winning_trades") or 0,
+            losing_trades=row.get("losing_trades") or 0,
+            profit=profit,
+            created_at=row["created_at"],
+            updated_at=row["updated_at"]
+        )
+
+# Build the validator/serializer at import rather than on the first request
+BotResponse.model_rebuild()
+# Encodes a whole list in one call; rows are trusted, so the list skips response_model validation
+_bot_list_adapter = TypeAdapter(List[BotResponse])
 
 @router.get("/", response_model=List[BotResponse])
+@handle_endpoint_errors("Failed to get bots", detail="Failed to fetch bots")
 async def get_bots(
     current_user: UserResponse = Depends(get_current_user)
 ):
     """
     Get all bots for current user
     """
-    try:
-        db_client = get_db_client()
-        
-        # Get user bots from database
-        bots = db_client.get_user_bots(current_user.id)
-        
-        # Convert to response models
-        bot_responses = []
-        for bot in bots:
-            # Parse datetime strings
-            created_at = datetime.fromisoformat(bot.get("created_at", datetime.utcnow().isoformat()))
-            updated_at = datetime.fromisoformat(bot.get("updated_at", datetime.utcnow().isoformat()))
-            
-            # Calculate current balance and profit from trades
-            trades = db_client.get_bot_trades(bot["id"], current_user.id, limit=1000)
-            total_trades = len(trades)
-            winning_trades = len([t for t in trades if t.get("profit", 0) > 0])
-            losing_trades = total_trades - winning_trades
-            total_profit = sum(t.get("profit", 0) for t in trades)
-            current_balance = bot.get("initial_balance", 0) + total_profit
-            
-            bot_response = BotResponse(
-                id=bot["id"],
-                user_id=bot["user_id"],
-                name=bot["name"],
-                exchange=bot["exchange"],
-                trading_pair=bot["trading_pair"],
-                timeframe=bot["timeframe"],
-                strategy=bot["strategy"],
-                status=bot.get("status", "stopped"),
-                initial_balance=bot.get("initial_balance", 0),
-                current_balance=current_balance,
-                total_trades=total_trades,
-                winning_trades=winning_trades,
-                losing_trades=losing_trades,
-                profit=total_profit,
-                created_at=created_at,
-                updated_at=updated_at
-            )
-            bot_responses.append(bot_response)
-        
-        logger.info("Retrieved user bots", user_id=current_user.id, count=len(bot_responses))
-        return bot_responses
-        
-    except Exception as e:
-        logger.error("Failed to get bots", user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch bots"
-        )
+    db_client = get_db_client()
+    
+    # Get user bots from database
+    bots = await db_client.get_user_bots(current_user.id)
+    
+    # Convert to response models
+    bot_responses = [BotResponse.from_row(bot) for bot in bots]
+    
+    logger.info("Retrieved user bots", user_id=current_user.id, count=len(bot_responses))
+    # Encoded straight to JSON bytes in one pass, skipping the intermediate dict tree
+    return Response(content=_bot_list_adapter.dump_json(bot_responses), media_type="application/json")
+
+@router.get("/stream")
+@handle_endpoint_errors("Failed to stream bots", detail="Failed to fetch bots")
+async def stream_bots(
+    current_user: UserResponse = Depends(get_current_user)
+):
+    """
+    Stream all bots for current user as newline-delimited JSON
+    """
+    db_client = get_db_client()
+    
+    # Bots are sent page by page as they are fetched instead of building the whole list
+    async def ndjson() -> AsyncIterator[bytes]:
+        async for bot in db_client.stream_user_bots(current_user.id):
+            yield BotResponse.from_row(bot).model_dump_json().encode() + b"\n"
+    
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
 
 @router.post("/", response_model=BotResponse)
+@handle_endpoint_errors("Failed to create bot")
 async def create_bot(
     bot_config: BotConfig,
     current_user: UserResponse = Depends(get_current_user)
@@ -116,141 +182,58 @@ async def create_bot(
     """
     Create new trading bot
     """
-    try:
-        db_client = get_db_client()
-        
-        # Prepare bot data for database
-        bot_record = {
-            "user_id": current_user.id,
-            "name": bot_config.name,
-            "exchange": bot_config.exchange,
-            "trading_pair": bot_config.trading_pair,
-            "timeframe": bot_config.timeframe,
-            "strategy": bot_config.strategy,
-            "initial_balance": bot_config.initial_balance,
-            "max_open_trades": bot_config.max_open_trades,
-            "stake_amount": bot_config.stake_amount,
-            "status": "stopped",  # New bots start as stopped
-            "current_balance": bot_config.initial_balance,  # Initially same as initial
-            "total_trades": 0,
-            "winning_trades": 0,
-            "losing_trades": 0,
-            "profit": 0.0,
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat()
-        }
-        
-        # Create bot in database
-        created_bot = db_client.create_bot(bot_record)
-        
-        if not created_bot:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to create bot"
-            )
-        
-        # Convert to response model
-        created_at = datetime.fromisoformat(created_bot.get("created_at"))
-        updated_at = datetime.fromisoformat(created_bot.get("updated_at"))
-        
-        bot_response = BotResponse(
-            id=created_bot["id"],
-            user_id=created_bot["user_id"],
-            name=created_bot["name"],
-            exchange=created_bot["exchange"],
-            trading_pair=created_bot["trading_pair"],
-            timeframe=created_bot["timeframe"],
-            strategy=created_bot["strategy"],
-            status=created_bot.get("status", "stopped"),
-            initial_balance=created_bot.get("initial_balance", 0),
-            current_balance=created_bot.get("current_balance", 0),
-            total_trades=created_bot.get("total_trades", 0),
-            winning_trades=created_bot.get("winning_trades", 0),
-            losing_trades=created_bot.get("losing_trades", 0),
-            profit=created_bot.get("profit", 0.0),
-            created_at=created_at,
-            updated_at=updated_at
-        )
-        
-        logger.info("Bot created", bot_id=created_bot["id"], user_id=current_user.id)
-        
-        return bot_response
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to create bot", user_id=current_user.id, error=str(e))
+    db_client = get_db_client()
+    
+    # Prepare bot data for database; status, trade statistics and
+    # timestamps come from column defaults
+    bot_record = {
+        "user_id": current_user.id,
+        "name": bot_config.name,
+        "exchange": bot_config.exchange.value,
+        "trading_pair": bot_config.trading_pair,
+        "timeframe": bot_config.timeframe.value,
+        "strategy": bot_config.strategy,
+        "initial_balance": bot_config.initial_balance,
+        "max_open_trades": bot_config.max_open_trades,
+        "stake_amount": bot_config.stake_amount,
+        "current_balance": bot_config.initial_balance  # Initially same as initial
+    }
+    
+    # Create bot in database (the inserted row is returned in the same request)
+    created_bot = await db_client.create_bot(bot_record)
+    
+    if not created_bot:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create bot"
         )
+    
+    # Convert to response model
+    bot_response = BotResponse.from_row(created_bot)
+    
+    logger.info("Bot created", bot_id=created_bot["id"], user_id=current_user.id)
+    
+    return bot_response
 
 @router.get("/{bot_id}", response_model=BotResponse)
+@handle_endpoint_errors("Failed to get bot", detail="Failed to fetch bot")
 async def get_bot(
     bot_id: str,
-    current_user: UserResponse = Depends(get_current_user)
+    current_user: UserResponse = Depends(get_current_user),
+    bot: Dict[str, Any] = Depends(get_owned_bot)
 ):
     """
     Get specific bot details
     """
-    try:
-        db_client = get_db_client()
-        
-        # Get bot with user authorization check
-        bot = db_client.get_bot_by_id(bot_id, current_user.id)
-        
-        if not bot:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Bot not found"
-            )
-        
-        # Parse datetime strings
-        created_at = datetime.fromisoformat(bot.get("created_at", datetime.utcnow().isoformat()))
-        updated_at = datetime.fromisoformat(bot.get("updated_at", datetime.utcnow().isoformat()))
-        
-        # Calculate current balance and profit from trades
-        trades = db_client.get_bot_trades(bot_id, current_user.id, limit=1000)
-        total_trades = len(trades)
-        winning_trades = len([t for t in trades if t.get("profit", 0) > 0])
-        losing_trades = total_trades - winning_trades
-        total_profit = sum(t.get("profit", 0) for t in trades)
-        current_balance = bot.get("initial_balance", 0) + total_profit
-        
-        # Convert to response model
-        bot_response = BotResponse(
-            id=bot["id"],
-            user_id=bot["user_id"],
-            name=bot["name"],
-            exchange=bot["exchange"],
-            trading_pair=bot["trading_pair"],
-            timeframe=bot["timeframe"],
-            strategy=bot["strategy"],
-            status=bot.get("status", "stopped"),
-            initial_balance=bot.get("initial_balance", 0),
-            current_balance=current_balance,
-            total_trades=total_trades,
-            winning_trades=winning_trades,
-            losing_trades=losing_trades,
-            profit=total_profit,
-            created_at=created_at,
-            updated_at=updated_at
-        )
-        
-        logger.info("Retrieved bot details", bot_id=bot_id, user_id=current_user.id)
-        
-        return bot_response
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to get bot", bot_id=bot_id, user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch bot"
-        )
+    # Convert to response model
+    bot_response = BotResponse.from_row(bot)
+    
+    logger.info("Retrieved bot details", bot_id=bot_id, user_id=current_user.id)
+    
+    return bot_response
 
 @router.put("/{bot_id}", response_model=BotResponse)
+@handle_endpoint_errors("Failed to update bot")
 async def update_bot(
     bot_id: str,
     bot_update: BotUpdate,
@@ -259,125 +242,78 @@ async def update_bot(
     """
     Update bot configuration
     """
-    try:
-        db_client = get_db_client()
-        
-        # Verify bot exists and belongs to user
-        existing_bot = db_client.get_bot_by_id(bot_id, current_user.id)
+    db_client = get_db_client()
+    
+    # Prepare update data with only non-None fields (updated_at is set by trigger)
+    update_data = {}
+    
+    if bot_update.name is not None:
+        update_data["name"] = bot_update.name
+    if bot_update.strategy is not None:
+        update_data["strategy"] = bot_update.strategy
+    if bot_update.max_open_trades is not None:
+        update_data["max_open_trades"] = bot_update.max_open_trades
+    if bot_update.stake_amount is not None:
+        update_data["stake_amount"] = bot_update.stake_amount
+    
+    if not update_data:
+        existing_bot = await db_client.get_bot_by_id(bot_id, current_user.id)
         if not existing_bot:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Bot not found"
             )
-        
-        # Prepare update data with only non-None fields
-        update_data = {"updated_at": datetime.utcnow().isoformat()}
-        
-        if bot_update.name is not None:
-            update_data["name"] = bot_update.name
-        if bot_update.strategy is not None:
-            update_data["strategy"] = bot_update.strategy
-        if bot_update.max_open_trades is not None:
-            update_data["max_open_trades"] = bot_update.max_open_trades
-        if bot_update.stake_amount is not None:
-            update_data["stake_amount"] = bot_update.stake_amount
-        
-        # Update bot in database
-        updated_bot = db_client.update_bot(bot_id, current_user.id, update_data)
-        
-        if not updated_bot:
+        return BotResponse.from_row(existing_bot)
+    
+    # The update is scoped to the owner and returns the row, so no separate
+    # ownership lookup; only on no-op tell "missing" from a failed write
+    updated_bot = await db_client.update_bot(bot_id, current_user.id, update_data)
+    
+    if not updated_bot:
+        if not await db_client.bot_exists(bot_id, current_user.id):
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to update bot"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Bot not found"
             )
-        
-        # Parse datetime strings
-        created_at = datetime.fromisoformat(updated_bot.get("created_at", datetime.utcnow().isoformat()))
-        updated_at = datetime.fromisoformat(updated_bot.get("updated_at", datetime.utcnow().isoformat()))
-        
-        # Calculate current balance and profit from trades
-        trades = db_client.get_bot_trades(bot_id, current_user.id, limit=1000)
-        total_trades = len(trades)
-        winning_trades = len([t for t in trades if t.get("profit", 0) > 0])
-        losing_trades = total_trades - winning_trades
-        total_profit = sum(t.get("profit", 0) for t in trades)
-        current_balance = updated_bot.get("initial_balance", 0) + total_profit
-        
-        # Convert to response model
-        bot_response = BotResponse(
-            id=updated_bot["id"],
-            user_id=updated_bot["user_id"],
-            name=updated_bot["name"],
-            exchange=updated_bot["exchange"],
-            trading_pair=updated_bot["trading_pair"],
-            timeframe=updated_bot["timeframe"],
-            strategy=updated_bot["strategy"],
-            status=updated_bot.get("status", "stopped"),
-            initial_balance=updated_bot.get("initial_balance", 0),
-            current_balance=current_balance,
-            total_trades=total_trades,
-            winning_trades=winning_trades,
-            losing_trades=losing_trades,
-            profit=total_profit,
-            created_at=created_at,
-            updated_at=updated_at
-        )
-        
-        logger.info("Bot updated", bot_id=bot_id, user_id=current_user.id)
-        
-        return bot_response
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to update bot", bot_id=bot_id, user_id=current_user.id, error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update bot"
         )
+    
+    # Convert to response model
+    bot_response = BotResponse.from_row(updated_bot)
+    
+    logger.info("Bot updated", bot_id=bot_id, user_id=current_user.id)
+    
+    return bot_response
 
 @router.delete("/{bot_id}")
+@handle_endpoint_errors("Failed to delete bot")
 async def delete_bot(
     bot_id: str,
-    current_user: UserResponse = Depends(get_current_user)
+    current_user: UserResponse = Depends(get_current_user),
+    existing_bot: Dict[str, Any] = Depends(get_owned_bot)
 ):
     """
     Delete bot
     """
-    try:
-        db_client = get_db_client()
-        
-        # Verify bot exists and belongs to user
-        existing_bot = db_client.get_bot_by_id(bot_id, current_user.id)
-        if not existing_bot:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Bot not found"
-            )
-        
-        # Delete bot from database
-        success = db_client.delete_bot(bot_id, current_user.id)
-        
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to delete bot"
-            )
-        
-        logger.info("Bot deleted", bot_id=bot_id, user_id=current_user.id)
-        
-        return {"message": "Bot deleted successfully"}
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to delete bot", bot_id=bot_id, user_id=current_user.id, error=str(e))
+    db_client = get_db_client()
+    
+    # Delete bot from database
+    success = await db_client.delete_bot(bot_id, current_user.id)
+    
+    if not success:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete bot"
         )
+    
+    logger.info("Bot deleted", bot_id=bot_id, user_id=current_user.id)
+    
+    return {"message": "Bot deleted successfully"}
 
 @router.post("/{bot_id}/start")
+@handle_endpoint_errors("Failed to start bot")
 async def start_bot(
     bot_id: str,
     current_user: UserResponse = Depends(get_current_user)
@@ -385,61 +321,36 @@ async def start_bot(
     """
     Start trading bot
     """
-    try:
-        db_client = get_db_client()
-        
-        # Verify bot exists and belongs to user
-        existing_bot = db_client.get_bot_by_id(bot_id, current_user.id)
-        if not existing_bot:
+    # Conditional update, batched with other transitions; on no-op tell
+    # "missing" from "already running"
+    changed = await get_bot_status_writer().transition(bot_id, current_user.id, "running")
+    
+    if not changed:
+        if not await get_db_client().bot_exists(bot_id, current_user.id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Bot not found"
             )
-        
-        # Check if bot is already running
-        if existing_bot.get("status") == "running":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Bot is already running"
-            )
-        
-        # Update bot status to running
-        update_data = {
-            "status": "running",
-            "updated_at": datetime.utcnow().isoformat()
-        }
-        
-        updated_bot = db_client.update_bot(bot_id, current_user.id, update_data)
-        
-        if not updated_bot:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to start bot"
-            )
-        
-        # TODO: In future, this would also:
-        # 1. Add bot to Redis queue for execution
-        # 2. Initialize bot runner process
-        # 3. Start real-time monitoring
-        
-        logger.info("Bot started", bot_id=bot_id, user_id=current_user.id)
-        
-        return {
-            "message": "Bot started successfully",
-            "status": "running",
-            "bot_id": bot_id
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to start bot", bot_id=bot_id, user_id=current_user.id, error=str(e))
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to start bot"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Bot is already running"
         )
+    
+    # TODO: In future, this would also:
+    # 1. Add bot to Redis queue for execution
+    # 2. Initialize bot runner process
+    # 3. Start real-time monitoring
+    
+    logger.info("Bot started", bot_id=bot_id, user_id=current_user.id)
+    
+    return {
+        "message": "Bot started successfully",
+        "status": "running",
+        "bot_id": bot_id
+    }
 
 @router.post("/{bot_id}/stop")
+@handle_endpoint_errors("Failed to stop bot")
 async def stop_bot(
     bot_id: str,
     current_user: UserResponse = Depends(get_current_user)
@@ -447,180 +358,152 @@ async def stop_bot(
     """
     Stop trading bot
     """
-    try:
-        db_client = get_db_client()
-        
-        # Verify bot exists and belongs to user
-        existing_bot = db_client.get_bot_by_id(bot_id, current_user.id)
-        if not existing_bot:
+    # Conditional update, batched with other transitions; on no-op tell
+    # "missing" from "already stopped"
+    changed = await get_bot_status_writer().transition(bot_id, current_user.id, "stopped")
+    
+    if not changed:
+        if not await get_db_client().bot_exists(bot_id, current_user.id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Bot not found"
             )
-        
-        # Check if bot is already stopped
-        if existing_bot.get("status") == "stopped":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Bot is already stopped"
-            )
-        
-        # Update bot status to stopped
-        update_data = {
-            "status": "stopped",
-            "updated_at": datetime.utcnow().isoformat()
-        }
-        
-        updated_bot = db_client.update_bot(bot_id, current_user.id, update_data)
-        
-        if not updated_bot:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to stop bot"
-            )
-        
-        # TODO: In future, this would also:
-        # 1. Remove bot from Redis queue
-        # 2. Stop bot runner process gracefully
-        # 3. Close any open positions if required
-        # 4. Save current state for next start
-        
-        logger.info("Bot stopped", bot_id=bot_id, user_id=current_user.id)
-        
-        return {
-            "message": "Bot stopped successfully",
-            "status": "stopped",
-            "bot_id": bot_id
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to stop bot", bot_id=bot_id, user_id=current_user.id, error=str(e))
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to stop bot"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Bot is already stopped"
         )
+    
+    # TODO: In future, this would also:
+    # 1. Remove bot from Redis queue
+    # 2. Stop bot runner process gracefully
+    # 3. Close any open positions if required
+    # 4. Save current state for next start
+    
+    logger.info("Bot stopped", bot_id=bot_id, user_id=current_user.id)
+    
+    return {
+        "message": "Bot stopped successfully",
+        "status": "stopped",
+        "bot_id": bot_id
+    }
+
+async def _compute_bot_status(bot_id: str, user_id: str, bot: Dict[str, Any]) -> bytes:
+    """Build the JSON-encoded status payload for a bot and store it in Redis"""
+    db_client = get_db_client()
+
+    # Today's aggregates are computed in SQL; only the last 10 trades are fetched
+    today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    summary, recent_trades = await asyncio.gather(
+        db_client.get_bot_trade_stats(bot_id, user_id, today_start),
+        db_client.get_recent_bot_trades(bot_id, user_id, limit=RECENT_TRADES_LIMIT, columns=RECENT_TRADE_COLUMNS)
+    )
+    summary = summary or {}
+
+    # Lifetime metrics are maintained on the bot row by the trades trigger
+    total_trades = bot.get("total_trades") or 0
+    winning_trades = bot.get("winning_trades") or 0
+    losing_trades = bot.get("losing_trades") or 0
+    total_profit = float(bot.get("profit") or 0)
+    current_balance = float(bot.get("initial_balance") or 0) + total_profit
+
+    # Calculate win rate
+    win_rate = (winning_trades / max(total_trades, 1)) * 100 if total_trades > 0 else 0
+
+    # Get last trade information
+    last_trade = recent_trades[0] if recent_trades else None
+    last_trade_time = summary.get("last_trade_at")
+    last_trade_profit = last_trade.get("profit", 0) if last_trade else None
+
+    today_profit = float(summary.get("today_profit") or 0)
+    today_trades = summary.get("today_trades") or 0
+
+    # Get bot configuration
+    config = {
+        "name": bot["name"],
+        "exchange": bot["exchange"],
+        "trading_pair": bot["trading_pair"],
+        "timeframe": bot["timeframe"],
+        "strategy": bot["strategy"],
+        "initial_balance": bot.get("initial_balance", 0),
+        "max_open_trades": bot.get("max_open_trades", 1),
+        "stake_amount": bot.get("stake_amount", 0)
+    }
+
+    # Prepare comprehensive status response
+    status_response = {
+        "bot_id": bot_id,
+        "status": bot.get("status", "stopped"),
+        "created_at": bot.get("created_at"),
+        "updated_at": bot.get("updated_at"),
+        "last_activity": last_trade_time,
+
+        # Performance metrics
+        "performance": {
+            "total_trades": total_trades,
+            "winning_trades": winning_trades,
+            "losing_trades": losing_trades,
+            "win_rate": round(win_rate, 2),
+            "total_profit": round(total_profit, 6),
+            "current_balance": round(current_balance, 6),
+            "initial_balance": bot.get("initial_balance", 0),
+            "profit_percentage": round((total_profit / max(bot.get("initial_balance", 1), 1)) * 100, 2),
+            "today_profit": round(today_profit, 6),
+            "today_trades": today_trades
+        },
+
+        # Last trade information
+        "last_trade": {
+            "timestamp": last_trade_time,
+            "profit": last_trade_profit,
+            "trading_pair": last_trade.get("trading_pair", bot.get("trading_pair", "")),
+            "side": last_trade.get("side", "buy"),
+            "amount": last_trade.get("amount", 0)
+        } if last_trade else None,
+
+        # Configuration
+        "config": config,
+
+        # Recent trades for debugging
+        "recent_trades": [
+            {
+                "timestamp": t.get("created_at"),
+                "profit": t.get("profit", 0),
+                "side": t.get("side", "buy"),
+                "trading_pair": t.get("trading_pair", ""),
+                "amount": t.get("amount", 0)
+            }
+            for t in recent_trades
+        ]
+    }
+
+    body = orjson.dumps(status_response)
+    await cache_set(bot_status_key(bot_id), body, ttl=BOT_STATUS_CACHE_TTL)
+    return body
+
 
 @router.get("/{bot_id}/status")
+@handle_endpoint_errors("Failed to get bot status", detail="Failed to fetch bot status")
 async def get_bot_status(
     bot_id: str,
-    current_user: UserResponse = Depends(get_current_user)
+    current_user: UserResponse = Depends(get_current_user),
+    bot: Dict[str, Any] = Depends(get_owned_bot)
 ):
     """
     Get real-time bot status
     """
-    try:
-        db_client = get_db_client()
-        
-        # Verify bot exists and belongs to user
-        bot = db_client.get_bot_by_id(bot_id, current_user.id)
-        if not bot:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Bot not found"
-            )
-        
-        # Get recent trades for performance calculation
-        trades = db_client.get_bot_trades(bot_id, current_user.id, limit=100)
-        recent_trades = trades[:10]  # Last 10 trades
-        
-        # Calculate real-time metrics
-        total_trades = len(trades)
-        winning_trades = len([t for t in trades if t.get("profit", 0) > 0])
-        losing_trades = total_trades - winning_trades
-        total_profit = sum(t.get("profit", 0) for t in trades)
-        current_balance = bot.get("initial_balance", 0) + total_profit
-        
-        # Calculate win rate
-        win_rate = (winning_trades / max(total_trades, 1)) * 100 if total_trades > 0 else 0
-        
-        # Get last trade information
-        last_trade = trades[0] if trades else None
-        last_trade_time = None
-        last_trade_profit = None
-        
-        if last_trade:
-            try:
-                last_trade_time = datetime.fromisoformat(last_trade.get("created_at", datetime.utcnow().isoformat()))
-                last_trade_profit = last_trade.get("profit", 0)
-            except:
-                pass
-        
-        # Calculate today's performance
-        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_trades = [t for t in trades if t.get("created_at") and 
-                       datetime.fromisoformat(t.get("created_at")) >= today_start]
-        today_profit = sum(t.get("profit", 0) for t in today_trades)
-        
-        # Get bot configuration
-        config = {
-            "name": bot["name"],
-            "exchange": bot["exchange"],
-            "trading_pair": bot["trading_pair"],
-            "timeframe": bot["timeframe"],
-            "strategy": bot["strategy"],
-            "initial_balance": bot.get("initial_balance", 0),
-            "max_open_trades": bot.get("max_open_trades", 1),
-            "stake_amount": bot.get("stake_amount", 0)
-        }
-        
-        # Prepare comprehensive status response
-        status_response = {
-            "bot_id": bot_id,
-            "status": bot.get("status", "stopped"),
-            "created_at": bot.get("created_at"),
-            "updated_at": bot.get("updated_at"),
-            "last_activity": last_trade_time.isoformat() if last_trade_time else None,
-            
-            # Performance metrics
-            "performance": {
-                "total_trades": total_trades,
-                "winning_trades": winning_trades,
-                "losing_trades": losing_trades,
-                "win_rate": round(win_rate, 2),
-                "total_profit": round(total_profit, 6),
-                "current_balance": round(current_balance, 6),
-                "initial_balance": bot.get("initial_balance", 0),
-                "profit_percentage": round((total_profit / max(bot.get("initial_balance", 1), 1)) * 100, 2),
-                "today_profit": round(today_profit, 6),
-                "today_trades": len(today_trades)
-            },
-            
-            # Last trade information
-            "last_trade": {
-                "timestamp": last_trade_time.isoformat() if last_trade_time else None,
-                "profit": last_trade_profit,
-                "trading_pair": last_trade.get("trading_pair", bot.get("trading_pair", "")),
-                "side": last_trade.get("side", "buy"),
-                "amount": last_trade.get("amount", 0)
-            } if last_trade else None,
-            
-            # Configuration
-            "config": config,
-            
-            # Recent trades for debugging
-            "recent_trades": [
-                {
-                    "timestamp": t.get("created_at"),
-                    "profit": t.get("profit", 0),
-                    "side": t.get("side", "buy"),
-                    "trading_pair": t.get("trading_pair", ""),
-                    "amount": t.get("amount", 0)
-                }
-                for t in recent_trades
-            ]
-        }
-        
-        logger.info("Retrieved bot status", bot_id=bot_id, user_id=current_user.id, status=bot.get("status"))
-        
-        return status_response
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to get bot status", bot_id=bot_id, user_id=current_user.id, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch bot status"
-        )
\ No newline at end of file
+    # Polling clients hit this every few seconds; serve a short-lived cached copy
+    cache_key = bot_status_key(bot_id)
+    cached = await cache_get(cache_key)
+    if cached:
+        return Response(content=cached, media_type="application/json")
+    
+    # Concurrent polls for the same bot (e.g. several open tabs) share one compute
+    body = await _status_flight.do(
+        bot_id, lambda: _compute_bot_status(bot_id, current_user.id, bot)
+    )
+    
+    logger.info("Retrieved bot status", bot_id=bot_id, user_id=current_user.id, status=bot.get("status"))
+    
+    # Already plain JSON types; hand orjson's bytes straight back instead of
+    # running the dict through jsonable_encoder
+    return Response(content=body, media_type="application/json")
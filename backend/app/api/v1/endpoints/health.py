@@ -2,34 +2,110 @@
 Health check and monitoring endpoints for NusaNexus NoFOMO
 """
 
-from fastapi import APIRouter, HTTPException, status
-from datetime import datetime
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from typing import Any, Dict, Optional, Tuple
+import asyncio
+import hashlib
+import orjson
 import structlog
 import psutil
-import os
 
-from app.core.database import get_db_client
+from app.core.cache import TTLCache, SingleFlight
+from app.core.clock import now_iso
 from app.core.config import settings
-from app.models.common import HealthStatus, DatabaseHealth, RedisHealth, ExchangeHealth
+from app.core.responses import ORJSONResponse
+from app.models.common import DatabaseHealth, RedisHealth, ExchangeHealth
+from app.services.health_monitor import HealthMonitor, get_health_monitor
+from app.services.system_sampler import get_system_sampler
 
 logger = structlog.get_logger()
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
+# Lets ingress/proxy caches absorb repeated probes from scrapers and uptime checkers
+PROBE_CACHE_CONTROL = "public, max-age=1, stale-while-revalidate=5"
 
-@router.get("/", response_model=HealthStatus)
-async def health_check():
-    """
-    Comprehensive health check endpoint
-    """
-    try:
-        # Check database health
-        db_client = get_db_client()
-        db_health = db_client.health_check()
-        
-        # Check system resources
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+# Seconds a subcheck result is shared by probes, scrapers and load-balancer checks
+DB_HEALTH_TTL = 2
+# Upper bound on how long /readiness waits for a database verdict
+READINESS_TIMEOUT = 2.0
+# The sampler refreshes CPU every second, so the rendered block can't change faster
+SYSTEM_BLOCK_TTL = 1
+
+_GB_INV = 1.0 / (1024 ** 3)
+_MB_INV = 1.0 / (1024 ** 2)
+
+# Reused so cpu_percent() measures since the previous request instead of returning 0.0
+_PROCESS = psutil.Process()
+
+_health_cache = TTLCache(ttl=DB_HEALTH_TTL, maxsize=16)
+_health_flight = SingleFlight()
+
+# (monitor.checked_at, encoded /health body, ETag) for the last rendered evaluation
+_rendered_health: Tuple[Optional[float], bytes, str] = (None, b"", "")
+
+
+async def _current_health() -> HealthMonitor:
+    """Latest background evaluation; only evaluated inline if the monitor has fallen behind"""
+    monitor = get_health_monitor()
+    if not monitor.is_fresh(DB_HEALTH_TTL + monitor.interval):
+        await _health_flight.do("evaluate", monitor.evaluate)
+    return monitor
+
+
+async def _db_health():
+    return (await _current_health()).db_health
+
+
+def _collect_sync() -> Dict[str, Any]:
+    """Blocking /proc reads needed by system_metrics, gathered in one pass"""
+    with _PROCESS.oneshot():
+        process_memory = _PROCESS.memory_info()
+        process_cpu = _PROCESS.cpu_percent()
+        process_threads = _PROCESS.num_threads()
+        process_status = _PROCESS.status()
+    
+    return {
+        "network": psutil.net_io_counters(),
+        "process_memory": process_memory,
+        "process_cpu": process_cpu,
+        "process_threads": process_threads,
+        "process_status": process_status
+    }
+
+
+async def _psutil_snapshot() -> Dict[str, Any]:
+    """Run the blocking psutil reads on the default executor, off the event loop"""
+    return await asyncio.to_thread(_collect_sync)
+
+
+def _system_block() -> Dict[str, Any]:
+    """Host section of /system, rendered from the sampler at most once per SYSTEM_BLOCK_TTL"""
+    block = _health_cache.get("system_block")
+    if block is None:
+        # CPU, memory, disk and load average from the background sampler
+        sample = get_system_sampler().snapshot()
+        memory = sample["memory"]
+        disk = sample["disk"]
+        block = {
+            "cpu_percent": sample["cpu_percent"],
+            "memory_percent": memory.percent,
+            "memory_used_gb": round(memory.used * _GB_INV, 2),
+            "memory_total_gb": round(memory.total * _GB_INV, 2),
+            "disk_percent": disk.percent,
+            "disk_used_gb": round(disk.used * _GB_INV, 2),
+            "disk_free_gb": round(disk.free * _GB_INV, 2),
+            "load_average": sample["load_avg"]
+        }
+        _health_cache.set("system_block", block, ttl=SYSTEM_BLOCK_TTL)
+    return block
+
+
+def _render_health(monitor: HealthMonitor) -> Tuple[bytes, str]:
+    """Encode the /health body once per monitor evaluation; requests in between reuse the bytes"""
+    global _rendered_health
+    checked_at, body, etag = _rendered_health
+    if checked_at != monitor.checked_at:
+        system = monitor.system
         
         # Check Redis (placeholder - would need Redis client)
         redis_health = {
@@ -48,37 +124,53 @@ async def health_check():
             "response_time_ms": 150.0
         }
         
-        # Determine overall status
-        overall_status = "healthy"
-        if db_health["status"] != "healthy":
-            overall_status = "unhealthy"
-        elif cpu_percent > 90 or memory.percent > 90:
-            overall_status = "degraded"
-        
         services = {
-            "database": db_health["status"],
+            "database": monitor.db_health["status"],
             "redis": redis_health["status"],
             "exchanges": exchange_health["status"],
-            "system": overall_status,
-            "system_cpu": f"{cpu_percent:.1f}%",
-            "system_memory": f"{memory.percent:.1f}%",
-            "system_disk": f"{disk.percent:.1f}%"
+            "system": monitor.status,
+            "system_cpu": f"{system['cpu_percent']:.1f}%",
+            "system_memory": f"{system['memory_percent']:.1f}%",
+            "system_disk": f"{system['disk_percent']:.1f}%"
         }
         
-        health_status = HealthStatus(
-            status=overall_status,
-            services=services
-        )
+        # Plain dict in the HealthStatus shape; timestamp is when this evaluation was rendered
+        body = orjson.dumps({
+            "status": monitor.status,
+            "timestamp": now_iso(),
+            "version": settings.app_version,
+            "services": services
+        })
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        _rendered_health = (monitor.checked_at, body, etag)
+    return body, etag
+
+
+@router.get("/")
+async def health_check(request: Request):
+    """
+    Comprehensive health check endpoint
+    """
+    try:
+        # Database and system status come from the background monitor
+        monitor = await _current_health()
+        body, etag = _render_health(monitor)
         
-        logger.info("Health check completed", status=overall_status, services=services)
-        return health_status
+        # Probe traffic: DEBUG is filtered out before any rendering unless settings.debug is on
+        logger.debug("Health check completed", status=monitor.status)
+        headers = {"Cache-Control": PROBE_CACHE_CONTROL, "ETag": etag}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
         
     except Exception as e:
-        logger.error("Health check failed", error=str(e))
-        return HealthStatus(
-            status="unhealthy",
-            services={"error": str(e)}
-        )
+        logger.error("Health check failed", exc_info=True)
+        return {
+            "status": "unhealthy",
+            "timestamp": now_iso(),
+            "version": settings.app_version,
+            "services": {"error": str(e)}
+        }
 
 
 @router.get("/database", response_model=DatabaseHealth)
@@ -87,8 +179,7 @@ async def database_health():
     Database-specific health check
     """
     try:
-        db_client = get_db_client()
-        health = db_client.health_check()
+        health = await _db_health()
         
         return DatabaseHealth(
             status=health["status"],
@@ -96,8 +187,8 @@ async def database_health():
             connected_clients=1  # Placeholder
         )
         
-    except Exception as e:
-        logger.error("Database health check failed", error=str(e))
+    except Exception:
+        logger.error("Database health check failed", exc_info=True)
         return DatabaseHealth(
             status="unhealthy",
             response_time_ms=None,
@@ -119,8 +210,8 @@ async def redis_health():
             connected_clients=1
         )
         
-    except Exception as e:
-        logger.error("Redis health check failed", error=str(e))
+    except Exception:
+        logger.error("Redis health check failed", exc_info=True)
         return RedisHealth(
             status="unhealthy",
             response_time_ms=None,
@@ -148,7 +239,7 @@ async def exchanges_health():
         )
         
     except Exception as e:
-        logger.error("Exchanges health check failed", error=str(e))
+        logger.error("Exchanges health check failed", exc_info=True)
         return ExchangeHealth(
             status="unhealthy",
             response_time_ms=None,
@@ -162,40 +253,20 @@ async def system_metrics():
     System metrics and resource usage
     """
     try:
-        # CPU and memory
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        network = psutil.net_io_counters()
-        
-        # Process info
-        process = psutil.Process()
-        process_memory = process.memory_info()
-        process_cpu = process.cpu_percent()
-        
-        # Load average (Unix only)
-        load_avg = None
-        if hasattr(os, 'getloadavg'):
-            load_avg = os.getloadavg()
+        # Network and process reads, off the event loop
+        snapshot = await _psutil_snapshot()
+        network = snapshot["network"]
+        process_memory = snapshot["process_memory"]
         
         return {
-            "timestamp": datetime.utcnow().isoformat(),
-            "system": {
-                "cpu_percent": cpu_percent,
-                "memory_percent": memory.percent,
-                "memory_used_gb": round(memory.used / (1024**3), 2),
-                "memory_total_gb": round(memory.total / (1024**3), 2),
-                "disk_percent": disk.percent,
-                "disk_used_gb": round(disk.used / (1024**3), 2),
-                "disk_free_gb": round(disk.free / (1024**3), 2),
-                "load_average": load_avg
-            },
+            "timestamp": now_iso(),
+            "system": _system_block(),
             "process": {
-                "cpu_percent": process_cpu,
-                "memory_mb": round(process_memory.rss / (1024**2), 2),
-                "memory_vms_mb": round(process_memory.vms / (1024**2), 2),
-                "threads": process.num_threads(),
-                "status": process.status()
+                "cpu_percent": snapshot["process_cpu"],
+                "memory_mb": round(process_memory.rss * _MB_INV, 2),
+                "memory_vms_mb": round(process_memory.vms * _MB_INV, 2),
+                "threads": snapshot["process_threads"],
+                "status": snapshot["process_status"]
             },
             "network": {
                 "bytes_sent": network.bytes_sent,
@@ -205,8 +276,8 @@ async def system_metrics():
             }
         }
         
-    except Exception as e:
-        logger.error("System metrics failed", error=str(e))
+    except Exception:
+        logger.error("System metrics failed", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch system metrics"
@@ -219,44 +290,20 @@ async def detailed_health_check():
     Detailed health check with all service status
     """
     try:
+        monitor = await _current_health()
+        system = monitor.system
+
         health_data = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "status": "healthy",
-            "services": {},
-            "metrics": {}
-        }
-        
-        # Database check
-        try:
-            db_client = get_db_client()
-            db_result = db_client.health_check()
-            health_data["services"]["database"] = db_result
-        except Exception as e:
-            health_data["services"]["database"] = {
-                "status": "unhealthy",
-                "error": str(e)
-            }
-            health_data["status"] = "unhealthy"
-        
-        # System metrics
-        try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            
-            health_data["metrics"] = {
-                "cpu_percent": cpu_percent,
-                "memory_percent": memory.percent,
+            "timestamp": now_iso(),
+            "status": monitor.status,
+            "services": {"database": monitor.db_health},
+            "metrics": {
+                "cpu_percent": system["cpu_percent"],
+                "memory_percent": system["memory_percent"],
                 "uptime": "unknown"  # Would calculate from process start time
             }
-            
-            # Mark as degraded if resources are high
-            if cpu_percent > 90 or memory.percent > 90:
-                health_data["status"] = "degraded"
-                
-        except Exception as e:
-            health_data["metrics"]["error"] = str(e)
-            health_data["status"] = "degraded"
-        
+        }
+
         # Configuration check
         health_data["config"] = {
             "app_name": settings.app_name,
@@ -270,28 +317,28 @@ async def detailed_health_check():
         return health_data
         
     except Exception as e:
-        logger.error("Detailed health check failed", error=str(e))
+        logger.error("Detailed health check failed", exc_info=True)
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(),
             "status": "unhealthy",
             "error": str(e)
         }
 
 
 @router.get("/readiness")
-async def readiness_probe():
+async def readiness_probe(response: Response):
     """
     Kubernetes-style readiness probe
     """
     try:
-        # Check if service is ready to receive traffic
-        db_client = get_db_client()
-        db_health = db_client.health_check()
+        # Check if service is ready to receive traffic; a stalled DB must not stall the probe
+        db_health = await asyncio.wait_for(_db_health(), timeout=READINESS_TIMEOUT)
         
         if db_health["status"] == "healthy":
+            response.headers["Cache-Control"] = PROBE_CACHE_CONTROL
             return {
                 "status": "ready",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
         else:
             raise HTTPException(
@@ -299,21 +346,16 @@ async def readiness_probe():
                 detail="Service not ready"
             )
             
-    except Exception as e:
-        logger.error("Readiness probe failed", error=str(e))
+    except asyncio.TimeoutError:
+        logger.error("Readiness probe timed out", timeout=READINESS_TIMEOUT)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="db timeout"
+        )
+    except Exception:
+        logger.error("Readiness probe failed", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Service not ready"
         )
 
-
-@router.get("/liveness")
-async def liveness_probe():
-    """
-    Kubernetes-style liveness probe
-    """
-    # Basic liveness check - service is running
-    return {
-        "status": "alive",
-        "timestamp": datetime.utcnow().isoformat()
-    }
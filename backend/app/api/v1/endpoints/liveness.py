@@ -0,0 +1,30 @@
+"""
+Liveness probe for NusaNexus NoFOMO
+
+Kept free of database, psutil and logging imports so the probe stays as cheap
+as possible; readiness and detailed checks live in health.py.
+"""
+
+import hashlib
+
+from fastapi import APIRouter, Request, Response
+
+router = APIRouter()
+
+_ALIVE_BODY = b'{"status":"alive"}'
+_ALIVE_HEADERS = {
+    # Same policy as the /health probes: intermediaries may answer repeat checks themselves
+    "Cache-Control": "public, max-age=1, stale-while-revalidate=5",
+    "ETag": f'"{hashlib.blake2b(_ALIVE_BODY, digest_size=8).hexdigest()}"'
+}
+
+
+@router.get("/liveness")
+async def liveness_probe(request: Request):
+    """
+    Kubernetes-style liveness probe
+    """
+    # Basic liveness check - service is running
+    if request.headers.get("if-none-match") == _ALIVE_HEADERS["ETag"]:
+        return Response(status_code=304, headers=_ALIVE_HEADERS)
+    return Response(content=_ALIVE_BODY, media_type="application/json", headers=_ALIVE_HEADERS)
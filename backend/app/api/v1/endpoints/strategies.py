@@ -10,9 +10,10 @@ import structlog
 
 from app.core.auth import get_current_user
 from app.core.database import get_db_client
+from app.core.responses import ORJSONResponse
 from app.models.strategy import (
     StrategyResponse, StrategyCreate, StrategyListResponse,
-    StrategyMarketplaceItem, StrategyPerformance
+    StrategyMarketplaceItem, StrategyPerformance, validate_strategies
 )
 from app.models.user import UserResponse
 
@@ -35,7 +36,7 @@ async def get_strategies(
         db_client = get_db_client()
         
         # Get user strategies
-        strategies = db_client.get_user_strategies(current_user.id)
+        strategies = await db_client.get_user_strategies(current_user.id)
         
         # Apply filters
         if strategy_type:
@@ -50,7 +51,7 @@ async def get_strategies(
         paginated_strategies = strategies[start:end]
         
         # Convert to response models
-        strategy_responses = [StrategyResponse(**strategy) for strategy in paginated_strategies]
+        strategy_responses = validate_strategies(paginated_strategies)
         
         # Calculate performance summary
         total_strategies = len(strategies)
@@ -74,7 +75,8 @@ async def get_strategies(
             performance_summary=StrategyPerformance(**avg_performance)
         )
         
-        return response
+        # Already validated above; dumped once and encoded with orjson, skipping response_model re-validation
+        return ORJSONResponse(response.model_dump(mode="json"))
         
     except Exception as e:
         logger.error("Failed to get strategies", user_id=current_user.id, error=str(e))
@@ -123,7 +125,7 @@ async def create_strategy(
         }
         
         # Create strategy in database
-        created_strategy = db_client.create_strategy(strategy_record)
+        created_strategy = await db_client.create_strategy(strategy_record)
         
         if not created_strategy:
             raise HTTPException(
@@ -157,7 +159,7 @@ async def get_strategy(
         db_client = get_db_client()
         
         # Get strategy
-        strategy = db_client.get_strategy_by_id(strategy_id)
+        strategy = await db_client.get_strategy_by_id(strategy_id)
         
         if not strategy:
             raise HTTPException(
@@ -199,7 +201,7 @@ async def get_marketplace_strategies(
         db_client = get_db_client()
         
         # Get marketplace strategies
-        strategies = db_client.get_marketplace_strategies()
+        strategies = await db_client.get_marketplace_strategies()
         
         # Apply filters
         if category:
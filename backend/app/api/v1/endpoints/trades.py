@@ -3,7 +3,9 @@ Trade management endpoints for NusaNexus NoFOMO
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from typing import Optional
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from typing import AsyncIterator, List, Optional
 from datetime import datetime, timedelta
 import structlog
 
@@ -18,6 +20,9 @@ from app.models.user import UserResponse
 logger = structlog.get_logger()
 router = APIRouter()
 
+# One compiled validator for a whole page of trade rows
+_trade_list_adapter = TypeAdapter(List[TradeResponse])
+
 
 @router.get("/", response_model=TradeListResponse)
 async def get_trades(
@@ -38,11 +43,15 @@ async def get_trades(
         # For now, using a placeholder approach
         all_trades = []
         if bot_id:
-            all_trades = db_client.get_bot_trades(bot_id, current_user.id, limit=1000)
+            all_trades = await db_client.get_recent_bot_trades(bot_id, current_user.id, limit=1000)
         else:
-            # This would need a method to get all user trades
-            # all_trades = db_client.get_user_trades(current_user.id)
-            pass
+            # Every bot's recent trades in one embedded query instead of one query per bot
+            bots = await db_client.get_user_bots_with_trades(current_user.id, trades_limit=1000)
+            all_trades = sorted(
+                (trade for bot in bots for trade in bot.get("trades") or []),
+                key=lambda trade: trade["created_at"],
+                reverse=True
+            )
         
         # Apply filters
         if status:
@@ -57,34 +66,40 @@ async def get_trades(
         paginated_trades = all_trades[start:end]
         
         # Convert to response models
-        trade_responses = [TradeResponse(**trade) for trade in paginated_trades]
+        trade_responses = _trade_list_adapter.validate_python(paginated_trades)
+        
+        # Aggregates over every matching trade, computed in SQL rather than over fetched rows
+        stats = await db_client.get_trade_statistics(current_user.id, bot_id, status, side) or {}
+        trade_count = stats.get("total_trades") or 0
+        total_profit = float(stats.get("total_profit") or 0)
+        total_fees = float(stats.get("total_fees") or 0)
+        gross_loss = float(stats.get("gross_loss") or 0)
         
-        # Calculate analytics
         analytics = TradeAnalytics(
-            total_trades=len(all_trades),
-            winning_trades=len([t for t in all_trades if t.get("profit", 0) > 0]),
-            losing_trades=len([t for t in all_trades if t.get("profit", 0) < 0]),
-            win_rate=len([t for t in all_trades if t.get("profit", 0) > 0]) / max(len(all_trades), 1) * 100,
-            total_profit=sum(t.get("profit", 0) for t in all_trades),
-            total_fees=sum(t.get("fee", 0) for t in all_trades),
-            net_profit=sum(t.get("profit", 0) - t.get("fee", 0) for t in all_trades),
-            profit_factor=1.0,  # Placeholder
-            avg_profit_per_trade=sum(t.get("profit", 0) for t in all_trades) / max(len(all_trades), 1),
-            best_trade=max([t.get("profit", 0) for t in all_trades]) if all_trades else 0.0,
-            worst_trade=min([t.get("profit", 0) for t in all_trades]) if all_trades else 0.0,
-            avg_holding_time=timedelta(hours=2),  # Placeholder
-            max_consecutive_wins=0,  # Placeholder
-            max_consecutive_losses=0,  # Placeholder
-            avg_trade_size=sum(t.get("amount", 0) for t in all_trades) / max(len(all_trades), 1),
-            largest_trade=max([t.get("amount", 0) for t in all_trades]) if all_trades else 0.0,
-            smallest_trade=min([t.get("amount", 0) for t in all_trades]) if all_trades else 0.0
+            total_trades=trade_count,
+            winning_trades=stats.get("winning_trades") or 0,
+            losing_trades=stats.get("losing_trades") or 0,
+            win_rate=(stats.get("winning_trades") or 0) / max(trade_count, 1) * 100,
+            total_profit=total_profit,
+            total_fees=total_fees,
+            net_profit=total_profit - total_fees,
+            profit_factor=float(stats.get("gross_profit") or 0) / gross_loss if gross_loss else 0.0,
+            avg_profit_per_trade=total_profit / max(trade_count, 1),
+            best_trade=float(stats.get("best_trade") or 0),
+            worst_trade=float(stats.get("worst_trade") or 0),
+            avg_holding_time=timedelta(seconds=stats.get("avg_holding_seconds") or 0),
+            max_consecutive_wins=stats.get("max_consecutive_wins") or 0,
+            max_consecutive_losses=stats.get("max_consecutive_losses") or 0,
+            avg_trade_size=float(stats.get("total_amount") or 0) / max(trade_count, 1),
+            largest_trade=float(stats.get("largest_trade") or 0),
+            smallest_trade=float(stats.get("smallest_trade") or 0)
         )
         
         # Calculate summary
         summary = TradeSummary(
             bot_id=bot_id or "all",
             period="all_time",
-            total_trades=len(all_trades),
+            total_trades=analytics.total_trades,
             winning_trades=analytics.winning_trades,
             losing_trades=analytics.losing_trades,
             total_profit=analytics.total_profit,
@@ -116,6 +131,24 @@ async def get_trades(
         )
 
 
+@router.get("/stream")
+async def stream_trades(
+    bot_id: Optional[str] = None,
+    current_user: UserResponse = Depends(get_current_user)
+):
+    """
+    Stream the full trade history for current user as newline-delimited JSON
+    """
+    db_client = get_db_client()
+    
+    # Rows are encoded and sent page by page, so memory stays flat however long the history is
+    async def ndjson() -> AsyncIterator[bytes]:
+        async for trade in db_client.stream_user_trades(current_user.id, bot_id):
+            yield TradeResponse(**trade).model_dump_json().encode() + b"\n"
+    
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.get("/open")
 async def get_open_trades(
     current_user: UserResponse = Depends(get_current_user)
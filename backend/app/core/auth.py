@@ -2,19 +2,137 @@
 Authentication middleware and dependencies for NusaNexus NoFOMO
 """
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+import hashlib
+import time
+import httpx
+import jwt
 import structlog
 
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.database import get_db_client
+from app.core.dataloader import DataLoader
 from app.core.supabase import get_auth_service, supabase_client
-from app.models.user import UserResponse, UserLogin, UserRegister
+from app.models.user import UserResponse, UserLogin, UserRegister, SubscriptionPlan
 from app.models.auth import Token, AuthResponse
 
 logger = structlog.get_logger()
 security = HTTPBearer()
 
+# Validated users keyed by token digest (raw tokens are never stored). Rejected
+# tokens are remembered briefly so guessing storms don't each reach Supabase.
+USER_CACHE_TTL = 60
+INVALID_TOKEN_TTL = 5
+_user_cache = TTLCache(ttl=USER_CACHE_TTL, maxsize=10_000)
+_INVALID = object()
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def invalidate_cached_user(token: str):
+    """Forget a cached token validation (e.g. on logout)"""
+    _user_cache.delete(_token_key(token))
+
+
+# Supabase access tokens are JWTs; verify them locally and only ask Supabase Auth
+# when no local key is available for the token
+JWKS_REFRESH_INTERVAL = 60
+_LOCAL_ALGORITHMS = {"HS256", "RS256", "ES256"}
+_jwks: Dict[str, Any] = {}
+_jwks_fetched_at = 0.0
+
+
+async def _refresh_jwks():
+    """Fetch the project's signing keys, at most once per JWKS_REFRESH_INTERVAL"""
+    global _jwks, _jwks_fetched_at
+    if not settings.supabase_url or time.monotonic() - _jwks_fetched_at < JWKS_REFRESH_INTERVAL:
+        return
+    _jwks_fetched_at = time.monotonic()
+    
+    try:
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            response = await client.get(f"{settings.supabase_url}/auth/v1/.well-known/jwks.json")
+            response.raise_for_status()
+        _jwks = {
+            key["kid"]: jwt.PyJWK(key).key
+            for key in response.json().get("keys", [])
+            if "kid" in key
+        }
+    except Exception as e:
+        logger.warning("Failed to refresh Supabase JWKS", error=str(e))
+
+
+async def _local_verification_key(token: str) -> Optional[Tuple[Any, str]]:
+    """Key and algorithm to verify token with, or None if it must be checked remotely"""
+    header = jwt.get_unverified_header(token)
+    algorithm = header.get("alg")
+    if algorithm not in _LOCAL_ALGORITHMS:
+        return None
+    
+    if algorithm == "HS256":
+        return (settings.supabase_jwt_secret, algorithm) if settings.supabase_jwt_secret else None
+    
+    kid = header.get("kid")
+    if kid not in _jwks:
+        await _refresh_jwks()
+    key = _jwks.get(kid)
+    return (key, algorithm) if key is not None else None
+
+
+async def _verify_token_locally(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Return verified claims, or None when no local key applies.
+    Raises jwt.PyJWTError for malformed, expired or badly signed tokens.
+    """
+    verification = await _local_verification_key(token)
+    if verification is None:
+        return None
+    
+    key, algorithm = verification
+    return jwt.decode(
+        token,
+        key,
+        algorithms=[algorithm],
+        audience="authenticated",
+        options={"require": ["exp", "sub"]}
+    )
+
+
+def _display_name(full_name: Optional[str], email: Optional[str]) -> str:
+    # model_construct skips validation, so a user who never set a name must not
+    # end up with full_name=None (UserProfile requires a string)
+    return full_name or email or ""
+
+
+def _user_from_claims(claims: Dict[str, Any]) -> UserResponse:
+    """Build the current user from verified token claims (timestamps are not in the token)"""
+    email = claims.get("email") or ""
+    return UserResponse.model_construct(
+        id=claims["sub"],
+        email=email,
+        full_name=_display_name((claims.get("user_metadata") or {}).get("full_name"), email),
+        subscription_plan=SubscriptionPlan.FREE,
+        created_at=None,
+        updated_at=None
+    )
+
+
+def _user_from_dict(data: Dict[str, Any]) -> UserResponse:
+    """Build a user from a Supabase Auth user payload (already validated upstream)"""
+    return UserResponse.model_construct(
+        id=data["id"],
+        email=data["email"],
+        full_name=_display_name(data.get("full_name"), data["email"]),
+        subscription_plan=SubscriptionPlan.FREE,
+        created_at=data.get("created_at"),
+        updated_at=data.get("updated_at")
+    )
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
@@ -24,31 +142,48 @@ async def get_current_user(
     """
     try:
         token = credentials.credentials
+        cache_key = _token_key(token)
+        
+        cached = _user_cache.get(cache_key)
+        if cached is _INVALID:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        if cached is not None:
+            return cached
+        
+        try:
+            claims = await _verify_token_locally(token)
+        except jwt.PyJWTError:
+            _user_cache.set(cache_key, _INVALID, ttl=INVALID_TOKEN_TTL)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
         
-        # Initialize Supabase client with the access token
-        supabase_client.init(access_token=token)
+        if claims is not None:
+            user = _user_from_claims(claims)
+            # Never serve a cached user past the token's own expiry
+            _user_cache.set(cache_key, user, ttl=min(USER_CACHE_TTL, claims["exp"] - time.time()))
+            return user
         
-        # Get user from Supabase Auth
+        # No local key for this token; fall back to Supabase Auth
         auth_service = get_auth_service()
         user_data = await auth_service.get_user(token)
         
         if not user_data:
+            _user_cache.set(cache_key, _INVALID, ttl=INVALID_TOKEN_TTL)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid or expired token",
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # Create UserResponse from Supabase user data
-        user = UserResponse(
-            id=user_data["id"],
-            email=user_data["email"],
-            full_name=user_data.get("full_name"),
-            subscription_plan="free",  # Default subscription plan
-            created_at=user_data.get("created_at"),
-            updated_at=user_data.get("updated_at")
-        )
-        
+        user = _user_from_dict(user_data)
+        _user_cache.set(cache_key, user)
         return user
         
     except HTTPException:
@@ -62,48 +197,50 @@ async def get_current_user(
         )
 
 
-async def get_optional_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
-) -> Optional[UserResponse]:
+async def get_optional_user(request: Request) -> Optional[UserResponse]:
     """
     Get current user if authenticated, None otherwise
     """
-    if not credentials:
+    # Parsed inline: the HTTPBearer dependency raises when the header is missing,
+    # which made anonymous requests fail instead of resolving to None
+    authorization = request.headers.get("authorization")
+    if not authorization:
+        return None
+    
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
         return None
     
     try:
-        return await get_current_user(credentials)
+        return await get_current_user(
+            HTTPAuthorizationCredentials(scheme=scheme, credentials=token)
+        )
     except HTTPException:
         return None
 
 
-async def require_user(
-    current_user: UserResponse = Depends(get_current_user)
-) -> UserResponse:
-    """
-    Dependency that requires authenticated user
-    """
-    return current_user
+_PLAN_LEVEL = {"free": 0, "pro": 1, "enterprise": 2}
 
 
-async def require_subscription(
-    min_plan: str = "free",
-    current_user: UserResponse = Depends(get_current_user)
-) -> UserResponse:
+def require_subscription(min_plan: str = "free"):
     """
-    Check user subscription level
+    Dependency factory checking the user's subscription level, e.g.
+    Depends(require_subscription("pro"))
     """
-    plan_hierarchy = {"free": 0, "pro": 1, "enterprise": 2}
-    user_plan_level = plan_hierarchy.get(current_user.subscription_plan, 0)
-    required_plan_level = plan_hierarchy.get(min_plan, 0)
+    required_level = _PLAN_LEVEL.get(min_plan, 0)
     
-    if user_plan_level < required_plan_level:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Subscription level '{min_plan}' or higher required"
-        )
+    async def _require_subscription(
+        current_user: UserResponse = Depends(get_current_user)
+    ) -> UserResponse:
+        if _PLAN_LEVEL.get(current_user.subscription_plan, 0) < required_level:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Subscription level '{min_plan}' or higher required"
+            )
+        
+        return current_user
     
-    return current_user
+    return _require_subscription
 
 
 # Authentication service functions (legacy compatibility)
@@ -123,14 +260,7 @@ async def login(credentials: UserLogin) -> AuthResponse:
             )
         
         user_data = result["user"]
-        user = UserResponse(
-            id=user_data["id"],
-            email=user_data["email"],
-            full_name=user_data.get("full_name"),
-            subscription_plan="free",
-            created_at=user_data.get("created_at"),
-            updated_at=user_data.get("updated_at")
-        )
+        user = _user_from_dict(user_data)
         
         return AuthResponse(
             success=True,
@@ -166,14 +296,7 @@ async def register(user_data: UserRegister) -> AuthResponse:
             )
         
         user_data = result["user"]
-        user = UserResponse(
-            id=user_data["id"],
-            email=user_data["email"],
-            full_name=user_data.get("full_name"),
-            subscription_plan="free",
-            created_at=user_data.get("created_at"),
-            updated_at=user_data.get("updated_at")
-        )
+        user = _user_from_dict(user_data)
         
         return AuthResponse(
             success=True,
@@ -197,6 +320,7 @@ async def logout(access_token: str) -> Dict[str, Any]:
     try:
         auth_service = get_auth_service()
         success = await auth_service.sign_out(access_token)
+        invalidate_cached_user(access_token)
         
         # Reset client state
         supabase_client.reset()
@@ -234,14 +358,7 @@ async def refresh_token(
             )
         
         user_data = result["user"]
-        user = UserResponse(
-            id=user_data["id"],
-            email=user_data["email"],
-            full_name=user_data.get("full_name"),
-            subscription_plan="free",
-            created_at=user_data.get("created_at"),
-            updated_at=user_data.get("updated_at")
-        )
+        user = _user_from_dict(user_data)
         
         return Token(
             access_token=result["access_token"],
@@ -300,14 +417,7 @@ async def exchange_oauth_code(
             )
         
         user_data = result["user"]
-        user = UserResponse(
-            id=user_data["id"],
-            email=user_data["email"],
-            full_name=user_data.get("full_name"),
-            subscription_plan="free",
-            created_at=user_data.get("created_at"),
-            updated_at=user_data.get("updated_at")
-        )
+        user = _user_from_dict(user_data)
         
         return AuthResponse(
             success=True,
@@ -385,13 +495,6 @@ async def update_password(
 
 
 # User profile endpoints
-async def get_user_profile(
-    current_user: UserResponse = Depends(get_current_user)
-) -> UserResponse:
-    """Get current user profile"""
-    return current_user
-
-
 async def update_user_profile(
     profile_data: Dict[str, Any],
     access_token: str
@@ -400,6 +503,7 @@ async def update_user_profile(
     try:
         auth_service = get_auth_service()
         result = await auth_service.update_user(access_token, profile_data)
+        invalidate_cached_user(access_token)
         
         if not result:
             raise HTTPException(
@@ -407,16 +511,7 @@ async def update_user_profile(
                 detail="Failed to update user profile"
             )
         
-        user = UserResponse(
-            id=result["id"],
-            email=result["email"],
-            full_name=result.get("full_name"),
-            subscription_plan="free",
-            created_at=result.get("created_at"),
-            updated_at=result.get("updated_at")
-        )
-        
-        return user
+        return _user_from_dict(result)
     except Exception as e:
         logger.error("Update user profile error", error=str(e))
         raise HTTPException(
@@ -426,14 +521,54 @@ async def update_user_profile(
 
 
 # Permission checking helpers
+async def get_owned_bot(
+    bot_id: str,
+    current_user: UserResponse = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """
+    Dependency that loads a bot owned by the current user or raises 404.
+    FastAPI evaluates it once per request, so composed dependencies share the lookup.
+    """
+    db_client = get_db_client()
+    bot = await db_client.get_bot_by_id(bot_id, current_user.id)
+    
+    if not bot:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Bot not found"
+        )
+    
+    return bot
+
+
+def get_bot_loader(
+    request: Request,
+    current_user: UserResponse = Depends(get_current_user)
+) -> DataLoader:
+    """Per-request loader batching the current user's bot lookups into one IN (...) query"""
+    loader = getattr(request.state, "bot_loader", None)
+    if loader is None:
+        loader = DataLoader(lambda ids: get_db_client().get_bots_by_ids(ids, current_user.id))
+        request.state.bot_loader = loader
+    return loader
+
+
+def get_strategy_loader(request: Request) -> DataLoader:
+    """Per-request loader batching strategy lookups into one IN (...) query"""
+    loader = getattr(request.state, "strategy_loader", None)
+    if loader is None:
+        loader = DataLoader(lambda ids: get_db_client().get_strategies_by_ids(ids))
+        request.state.strategy_loader = loader
+    return loader
+
+
 async def check_bot_access(
     bot_id: str,
-    user: UserResponse = Depends(get_current_user)
+    bot_loader: DataLoader = Depends(get_bot_loader)
 ) -> bool:
     """Check if user has access to a specific bot"""
     try:
-        db_client = get_db_client()
-        bot = db_client.get_bot_by_id(bot_id, user.id)
+        bot = await bot_loader.load(bot_id)
         return bot is not None
     except Exception:
         return False
@@ -441,12 +576,12 @@ async def check_bot_access(
 
 async def check_strategy_access(
     strategy_id: str,
-    user: UserResponse = Depends(get_current_user)
+    user: UserResponse = Depends(get_current_user),
+    strategy_loader: DataLoader = Depends(get_strategy_loader)
 ) -> bool:
     """Check if user has access to a specific strategy"""
     try:
-        db_client = get_db_client()
-        strategy = db_client.get_strategy_by_id(strategy_id)
+        strategy = await strategy_loader.load(strategy_id)
         
         if not strategy:
             return False
@@ -454,4 +589,4 @@ async def check_strategy_access(
         # User can access if they own it or it's public
         return strategy.get("user_id") == user.id or strategy.get("is_public", False)
     except Exception:
-        return False
\ No newline at end of file
+        return False
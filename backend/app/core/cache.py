@@ -0,0 +1,72 @@
+"""
+In-process caching utilities for NusaNexus NoFOMO
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class TTLCache:
+    """Small in-memory key/value cache with per-entry time-to-live"""
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[str, Tuple[float, Any]] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return cached value or default if missing/expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store value under key for ttl seconds (defaults to cache ttl)"""
+        if len(self._data) >= self.maxsize and key not in self._data:
+            self._evict()
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def delete(self, key: str):
+        """Remove a single key"""
+        self._data.pop(key, None)
+
+    def delete_prefix(self, prefix: str):
+        """Remove every key starting with prefix"""
+        for key in [k for k in self._data if k.startswith(prefix)]:
+            del self._data[key]
+
+    def clear(self):
+        """Remove all entries"""
+        self._data.clear()
+
+    def _evict(self):
+        """Drop expired entries, falling back to the oldest insertion"""
+        now = time.monotonic()
+        for key in [k for k, (expires_at, _) in self._data.items() if expires_at < now]:
+            del self._data[key]
+        if len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one in-flight computation"""
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn for key, or await the result of a call already in flight"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one cancelled caller doesn't cancel the shared work
+        return await asyncio.shield(task)
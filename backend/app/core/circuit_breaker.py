@@ -0,0 +1,60 @@
+"""
+Circuit breaker for outbound calls in NusaNexus NoFOMO
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of making a call while the breaker is open"""
+
+
+class CircuitBreaker:
+    """Fails fast after consecutive failures, then lets a single probe call through once reset_timeout passes"""
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 10.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_call(self) -> bool:
+        """Raise CircuitOpenError unless a call may go out now; returns whether the call is the half-open probe"""
+        if self._opened_at is None:
+            return False
+        if self._probing or time.monotonic() - self._opened_at < self.reset_timeout:
+            raise CircuitOpenError("circuit open")
+        # Half-open: this caller is the probe; everyone else keeps failing fast until it settles
+        self._probing = True
+        return True
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """Wrap one call; the block reports its outcome with record_success/record_failure"""
+        probe = self.before_call()
+        try:
+            yield
+        finally:
+            if probe and self._probing:
+                # The probe ended without an outcome (e.g. it was cancelled): stay open and let
+                # another probe through after reset_timeout instead of failing fast forever
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    def record_success(self):
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self):
+        self._failures += 1
+        if self._probing or self._failures >= self.fail_max:
+            self._opened_at = time.monotonic()
+        self._probing = False
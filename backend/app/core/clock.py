@@ -0,0 +1,30 @@
+"""
+Cached wall-clock timestamps for NusaNexus NoFOMO
+"""
+
+from datetime import datetime, timezone
+import time
+
+# Seconds a formatted timestamp is reused across callers; only for display payloads
+# (WebSocket messages, health bodies), never for persisted rows
+CLOCK_RESOLUTION = 0.05
+
+_UTC = timezone.utc
+
+_clock_at = float("-inf")
+_clock_iso = ""
+
+
+def now_iso() -> str:
+    """Timezone-aware UTC ISO timestamp, reformatted at most once per CLOCK_RESOLUTION"""
+    global _clock_at, _clock_iso
+    now = time.monotonic()
+    if now - _clock_at >= CLOCK_RESOLUTION:
+        _clock_iso = datetime.now(_UTC).isoformat(timespec='milliseconds')
+        _clock_at = now
+    return _clock_iso
+
+
+def utcnow_iso() -> str:
+    """Uncached, microsecond UTC ISO timestamp for rows that are ordered by created_at"""
+    return datetime.now(_UTC).isoformat()
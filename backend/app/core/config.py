@@ -2,6 +2,7 @@
 Configuration settings for NusaNexus NoFOMO
 """
 
+from functools import cached_property, lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional, List
 
@@ -21,20 +22,22 @@ class Settings(BaseSettings):
     allowed_origins: str = "http://localhost:3000"
     allowed_hosts: str = "localhost,*.nusafxtrade.com,*.onrender.com"
     
-    @property
+    @cached_property
     def cors_origins(self) -> List[str]:
-        """Parse allowed origins from comma-separated string"""
+        """Parse allowed origins from comma-separated string (once per Settings instance)"""
         return [origin.strip() for origin in self.allowed_origins.split(',')]
     
-    @property
+    @cached_property
     def trusted_hosts(self) -> List[str]:
-        """Parse allowed hosts from comma-separated string"""
+        """Parse allowed hosts from comma-separated string (once per Settings instance)"""
         return [host.strip() for host in self.allowed_hosts.split(',')]
     
     # Supabase settings
     supabase_url: Optional[str] = None
     supabase_key: Optional[str] = None
     supabase_service_role_key: Optional[str] = None
+    # Legacy HS256 signing secret; asymmetric keys are fetched from the project JWKS
+    supabase_jwt_secret: Optional[str] = None
     
     # Redis settings
     redis_url: str = "redis://localhost:6379"
@@ -58,7 +61,14 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
         case_sensitive = True
+        frozen = True
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Load settings once per process"""
+    return Settings()
 
 
 # Create settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -2,14 +2,84 @@
 Database client for NusaNexus NoFOMO
 """
 
-from typing import Optional, Dict, Any, List
-from datetime import datetime
-from supabase import create_client, Client
+from typing import Optional, Dict, Any, Iterable, List, AsyncIterator, Tuple
+from datetime import datetime, timezone
+import asyncio
+import random
+import threading
+import time
+import httpx
+from postgrest.types import ReturnMethod
+from supabase import AsyncClient
 from app.core.config import settings
+from app.core.cache import SingleFlight, TTLCache
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.redis import (
+    CACHE_INVALIDATION_CHANNEL, bot_status_key, cache_delete, cache_get, cache_publish, cache_set
+)
+import orjson
 import structlog
 
 logger = structlog.get_logger()
 
+# Seconds a row stays in the in-process read cache; writers through this client evict eagerly
+USER_CACHE_TTL = 30
+STRATEGY_CACHE_TTL = 30
+BOT_CACHE_TTL = 5
+MARKETPLACE_CACHE_TTL = 300
+MARKETPLACE_CACHE_KEY = "marketplace"
+
+# Seconds a row stays in the Redis read cache shared by all workers. Bot rows are also
+# written by the bot runner outside this client, so they are only shared briefly.
+USER_SHARED_TTL = 300
+BOT_SHARED_TTL = 5
+MARKETPLACE_SHARED_TTL = 300
+
+# Column projections for list reads: the fields their responses render, without the large
+# JSONB/text columns (bots.metadata, strategies.content/parameters/backtest_results)
+BOT_SUMMARY_COLUMNS = (
+    "id,user_id,name,exchange,trading_pair,timeframe,strategy,status,initial_balance,"
+    "current_balance,total_trades,winning_trades,losing_trades,profit,profit_percentage,"
+    "last_trade_at,created_at,updated_at"
+)
+MARKETPLACE_STRATEGY_COLUMNS = (
+    "id,name,description,strategy_type,risk_level,category,tags,performance,is_verified,"
+    "created_at,updated_at"
+)
+
+# Most queries one composite read keeps in flight against PostgREST at once
+FANOUT_CONCURRENCY = 4
+
+# PostgREST transport: one pooled HTTP/2 session per client, so concurrent queries share connections
+POSTGREST_TIMEOUT = httpx.Timeout(10.0, connect=2.0)
+POSTGREST_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+# Requests that failed before reaching PostgREST are retried with jittered exponential backoff;
+# after DB_BREAKER_FAIL_MAX consecutive transport failures calls fail fast for DB_BREAKER_RESET_SECONDS
+DB_RETRY_ATTEMPTS = 3
+DB_RETRY_BASE_DELAY = 0.05
+DB_RETRY_MAX_DELAY = 2.0
+DB_BREAKER_FAIL_MAX = 5
+DB_BREAKER_RESET_SECONDS = 10.0
+# Never sent, so safe to retry even for writes
+_RETRYABLE_ERRORS = (httpx.PoolTimeout, httpx.ConnectTimeout, httpx.ConnectError)
+
+
+def _use_pooled_http2_session(client: AsyncClient):
+    """Swap the client's PostgREST session for a pooled HTTP/2 one with the same URL and headers"""
+    postgrest = client.postgrest
+    session = postgrest.session
+    # supabase 2.0.0 has no option to pass an httpx client in, so the idle default session is replaced
+    postgrest.session = httpx.AsyncClient(
+        base_url=session.base_url,
+        headers=session.headers,
+        timeout=POSTGREST_TIMEOUT,
+        limits=POSTGREST_LIMITS,
+        http2=True,
+        follow_redirects=True
+    )
+
+
 class SupabaseClient:
     """Supabase client wrapper with NusaNexus-specific methods"""
     
@@ -17,238 +87,638 @@ class SupabaseClient:
         if not settings.supabase_url or not settings.supabase_key:
             raise ValueError("Supabase URL and key must be configured")
         
-        self.client: Client = create_client(settings.supabase_url, settings.supabase_key)
-        self.service_role_client: Optional[Client] = None
+        # Async client: PostgREST calls are awaited directly and share one keep-alive HTTP session
+        self.client: AsyncClient = AsyncClient(settings.supabase_url, settings.supabase_key)
+        _use_pooled_http2_session(self.client)
+        # Memo for read-heavy single-row lookups (users, bots, strategies, marketplace list)
+        self._read_cache = TTLCache(ttl=USER_CACHE_TTL, maxsize=10_000)
+        # Concurrent cache misses for the same key share one query
+        self._inflight = SingleFlight()
+        self._breaker = CircuitBreaker(fail_max=DB_BREAKER_FAIL_MAX, reset_timeout=DB_BREAKER_RESET_SECONDS)
+        self.service_role_client: Optional[AsyncClient] = None
         
         # Initialize service role client if service key is available
         if settings.supabase_service_role_key:
-            self.service_role_client = create_client(
+            self.service_role_client = AsyncClient(
                 settings.supabase_url, 
                 settings.supabase_service_role_key
             )
+            _use_pooled_http2_session(self.service_role_client)
+    
+    @property
+    def privileged_client(self) -> AsyncClient:
+        """Client for SQL functions that take the user id as an argument. Those are revoked from
+        anon/authenticated so they can't be called over /rpc with someone else's id; only the
+        service role may execute them"""
+        return self.service_role_client or self.client
+    
+    async def _execute(self, query):
+        """Run a PostgREST request on the event loop, retrying connection failures behind a circuit breaker"""
+        with self._breaker.guard():
+            for attempt in range(DB_RETRY_ATTEMPTS):
+                try:
+                    response = await query.execute()
+                except _RETRYABLE_ERRORS:
+                    if attempt + 1 == DB_RETRY_ATTEMPTS:
+                        self._breaker.record_failure()
+                        raise
+                    await asyncio.sleep(random.uniform(0, min(DB_RETRY_MAX_DELAY, DB_RETRY_BASE_DELAY * 2 ** attempt)))
+                except httpx.TransportError:
+                    self._breaker.record_failure()
+                    raise
+                except Exception:
+                    # PostgREST answered (e.g. a constraint error), so the database is reachable
+                    self._breaker.record_success()
+                    raise
+                else:
+                    self._breaker.record_success()
+                    return response
+    
+    async def close(self):
+        """Close the underlying PostgREST HTTP sessions"""
+        for client in (self.client, self.service_role_client):
+            if client is not None:
+                await client.postgrest.aclose()
+    
+    async def _cache_lookup(self, key: str, ttl: float) -> Optional[Any]:
+        """Read-cache lookup: in-process first, then Redis (an L2 hit refills the local entry)"""
+        value = self._read_cache.get(key)
+        if value is None:
+            raw = await cache_get(f"db:{key}")
+            if raw is not None:
+                value = orjson.loads(raw)
+                self._read_cache.set(key, value, ttl=ttl)
+        return value
+    
+    async def _cache_store(self, key: str, value: Any, ttl: float, shared_ttl: int):
+        """Populate both read-cache tiers"""
+        self._read_cache.set(key, value, ttl=ttl)
+        await cache_set(f"db:{key}", orjson.dumps(value), shared_ttl)
+    
+    async def _invalidate_shared(self, *keys: str, extra: Iterable[str] = ()):
+        """Drop keys from Redis and tell peer workers to evict them from their in-process caches"""
+        await cache_delete(*(f"db:{key}" for key in keys), *extra)
+        await cache_publish(CACHE_INVALIDATION_CHANNEL, orjson.dumps(keys))
     
-    def get_current_user(self, token: str) -> Optional[Dict[str, Any]]:
+    def evict_local(self, keys: Iterable[str]):
+        """Evict keys from this worker's in-process read cache"""
+        for key in keys:
+            self._read_cache.delete(key)
+    
+    def _invalidate_strategy(self, strategy_id: str):
+        # The strategy may also appear in the cached marketplace list
+        self._read_cache.delete(f"strategy:{strategy_id}")
+        self._read_cache.delete(MARKETPLACE_CACHE_KEY)
+    
+    async def get_current_user(self, token: str) -> Optional[Dict[str, Any]]:
         """Get current user from JWT token"""
         try:
-            response = self.client.auth.get_user(token)
+            response = await self.client.auth.get_user(token)
             return response.user.__dict__ if response.user else None
         except Exception as e:
             logger.error("Failed to get current user", error=str(e))
             return None
     
-    def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
+    async def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user by ID"""
+        cache_key = f"user:{user_id}"
+        cached = await self._cache_lookup(cache_key, USER_CACHE_TTL)
+        if cached is not None:
+            return dict(cached)
+        
+        user = await self._inflight.do(cache_key, lambda: self._load_user(user_id, cache_key))
+        return dict(user) if user else None
+    
+    async def _load_user(self, user_id: str, cache_key: str) -> Optional[Dict[str, Any]]:
         try:
-            response = self.client.table('users').select('*').eq('id', user_id).execute()
-            return response.data[0] if response.data else None
+            response = await self._execute(self.client.table('users').select('*').eq('id', user_id))
+            if not response.data:
+                return None
+            await self._cache_store(cache_key, response.data[0], USER_CACHE_TTL, USER_SHARED_TTL)
+            return response.data[0]
         except Exception as e:
             logger.error("Failed to get user by ID", user_id=user_id, error=str(e))
             return None
     
-    def create_user(self, user_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def create_user(self, user_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create new user"""
         try:
-            response = self.client.table('users').insert(user_data).execute()
+            response = await self._execute(self.client.table('users').insert(user_data))
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error("Failed to create user", error=str(e))
             return None
     
-    def update_user(self, user_id: str, user_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def update_user(self, user_id: str, user_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update user data"""
+        self._read_cache.delete(f"user:{user_id}")
         try:
-            response = self.client.table('users').update(user_data).eq('id', user_id).execute()
+            response = await self._execute(self.client.table('users').update(user_data).eq('id', user_id))
+            await self._invalidate_shared(f"user:{user_id}")
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error("Failed to update user", user_id=user_id, error=str(e))
             return None
     
-    def get_user_bots(self, user_id: str) -> List[Dict[str, Any]]:
-        """Get all bots for a user"""
+    async def get_user_stats(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Get aggregated bot/strategy statistics for a user"""
+        try:
+            response = await self._execute(self.privileged_client.rpc('get_user_stats', {'uid': user_id}))
+            return response.data[0] if response.data else None
+        except Exception as e:
+            logger.error("Failed to get user stats", user_id=user_id, error=str(e))
+            return None
+    
+    async def get_user_bots(self, user_id: str, columns: str = BOT_SUMMARY_COLUMNS) -> List[Dict[str, Any]]:
+        """Get all bots for a user (summary columns unless `columns` asks for more)"""
         try:
-            response = self.client.table('bots').select('*').eq('user_id', user_id).execute()
+            response = await self._execute(self.client.table('bots').select(columns).eq('user_id', user_id))
             return response.data or []
         except Exception as e:
             logger.error("Failed to get user bots", user_id=user_id, error=str(e))
             return []
     
-    def get_bot_by_id(self, bot_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+    async def get_user_bots_with_trades(self, user_id: str, trades_limit: int, trade_columns: str = '*') -> List[Dict[str, Any]]:
+        """Get all bots for a user with each bot's newest trades embedded under 'trades' (one request)"""
+        try:
+            response = await self._execute(
+                self.client.table('bots').select(f'*, trades({trade_columns})').eq('user_id', user_id)
+                .order('created_at', desc=True, foreign_table='trades')
+                .limit(trades_limit, foreign_table='trades')
+            )
+            return response.data or []
+        except Exception as e:
+            logger.error("Failed to get user bots with trades", user_id=user_id, error=str(e))
+            return []
+    
+    async def stream_user_bots(
+        self, user_id: str, page_size: int = 100, columns: str = BOT_SUMMARY_COLUMNS
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield all bots for a user, oldest first, fetching one page at a time"""
+        offset = 0
+        while True:
+            query = (
+                self.client.table('bots').select(columns).eq('user_id', user_id)
+                .order('created_at').order('id').range(offset, offset + page_size - 1)
+            )
+            try:
+                response = await self._execute(query)
+            except Exception as e:
+                logger.error("Failed to stream user bots", user_id=user_id, offset=offset, error=str(e))
+                return
+            
+            rows = response.data or []
+            for row in rows:
+                yield row
+            
+            if len(rows) < page_size:
+                return
+            offset += page_size
+    
+    async def get_bot_by_id(self, bot_id: str, user_id: str) -> Optional[Dict[str, Any]]:
         """Get bot by ID (user-specific)"""
+        cache_key = f"bot:{bot_id}:{user_id}"
+        cached = await self._cache_lookup(cache_key, BOT_CACHE_TTL)
+        if cached is not None:
+            return dict(cached)
+        
+        bot = await self._inflight.do(cache_key, lambda: self._load_bot(bot_id, user_id, cache_key))
+        return dict(bot) if bot else None
+    
+    async def _load_bot(self, bot_id: str, user_id: str, cache_key: str) -> Optional[Dict[str, Any]]:
         try:
-            response = self.client.table('bots').select('*').eq('id', bot_id).eq('user_id', user_id).execute()
-            return response.data[0] if response.data else None
+            response = await self._execute(self.client.table('bots').select('*').eq('id', bot_id).eq('user_id', user_id))
+            if not response.data:
+                return None
+            await self._cache_store(cache_key, response.data[0], BOT_CACHE_TTL, BOT_SHARED_TTL)
+            return response.data[0]
         except Exception as e:
             logger.error("Failed to get bot by ID", bot_id=bot_id, user_id=user_id, error=str(e))
             return None
     
-    def create_bot(self, bot_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def create_bot(self, bot_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create new bot"""
         try:
-            response = self.client.table('bots').insert(bot_data).execute()
+            response = await self._execute(self.client.table('bots').insert(bot_data))
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error("Failed to create bot", error=str(e))
             return None
     
-    def update_bot(self, bot_id: str, user_id: str, bot_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def update_bot(self, bot_id: str, user_id: str, bot_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update bot"""
+        self._read_cache.delete(f"bot:{bot_id}:{user_id}")
         try:
-            response = self.client.table('bots').update(bot_data).eq('id', bot_id).eq('user_id', user_id).execute()
+            response = await self._execute(self.client.table('bots').update(bot_data).eq('id', bot_id).eq('user_id', user_id))
+            await self._invalidate_shared(f"bot:{bot_id}:{user_id}", extra=[bot_status_key(bot_id)])
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error("Failed to update bot", bot_id=bot_id, error=str(e))
             return None
     
-    def delete_bot(self, bot_id: str, user_id: str) -> bool:
+    async def get_bots_by_ids(self, bot_ids: List[str], user_id: str) -> Dict[str, Dict[str, Any]]:
+        """Get several of a user's bots in one query, keyed by bot ID"""
+        try:
+            response = await self._execute(self.client.table('bots').select('*').in_('id', bot_ids).eq('user_id', user_id))
+            return {bot['id']: bot for bot in response.data or []}
+        except Exception as e:
+            logger.error("Failed to get bots by IDs", count=len(bot_ids), error=str(e))
+            return {}
+    
+    async def transition_bot_status(self, bot_id: str, user_id: str, new_status: str) -> Optional[Dict[str, Any]]:
+        """Atomically set bot status unless it already has it; None if not owned or unchanged"""
+        self._read_cache.delete(f"bot:{bot_id}:{user_id}")
+        try:
+            response = await self._execute(
+                self.client.table('bots').update({'status': new_status})
+                .eq('id', bot_id).eq('user_id', user_id).neq('status', new_status)
+            )
+            await self._invalidate_shared(f"bot:{bot_id}:{user_id}", extra=[bot_status_key(bot_id)])
+            return response.data[0] if response.data else None
+        except Exception as e:
+            logger.error("Failed to transition bot status", bot_id=bot_id, status=new_status, error=str(e))
+            return None
+    
+    async def transition_bot_statuses(self, updates: List[Dict[str, str]]) -> Optional[List[str]]:
+        """Apply [{id, user_id, status}] transitions in one UPDATE; returns ids that changed, None on failure"""
+        for update in updates:
+            self._read_cache.delete(f"bot:{update['id']}:{update['user_id']}")
+        try:
+            response = await self._execute(self.privileged_client.rpc('transition_bot_statuses', {'p_updates': updates}))
+            await self._invalidate_shared(
+                *(f"bot:{update['id']}:{update['user_id']}" for update in updates),
+                extra=[bot_status_key(update['id']) for update in updates]
+            )
+            return [row['id'] for row in response.data or []]
+        except Exception as e:
+            logger.error("Failed to transition bot statuses", count=len(updates), error=str(e))
+            return None
+    
+    async def bot_exists(self, bot_id: str, user_id: str) -> bool:
+        """Check whether a bot exists for the user"""
+        try:
+            response = await self._execute(
+                self.client.table('bots').select('id').eq('id', bot_id).eq('user_id', user_id).limit(1)
+            )
+            return bool(response.data)
+        except Exception as e:
+            logger.error("Failed to check bot existence", bot_id=bot_id, error=str(e))
+            return False
+    
+    async def delete_bot(self, bot_id: str, user_id: str) -> bool:
         """Delete bot"""
+        self._read_cache.delete(f"bot:{bot_id}:{user_id}")
         try:
-            response = self.client.table('bots').delete().eq('id', bot_id).eq('user_id', user_id).execute()
+            response = await self._execute(self.client.table('bots').delete().eq('id', bot_id).eq('user_id', user_id))
+            await self._invalidate_shared(f"bot:{bot_id}:{user_id}", extra=[bot_status_key(bot_id)])
             return len(response.data) > 0
         except Exception as e:
             logger.error("Failed to delete bot", bot_id=bot_id, error=str(e))
             return False
     
-    def get_user_strategies(self, user_id: str) -> List[Dict[str, Any]]:
+    async def get_user_strategies(self, user_id: str) -> List[Dict[str, Any]]:
         """Get all strategies for a user"""
         try:
-            response = self.client.table('strategies').select('*').eq('user_id', user_id).execute()
+            response = await self._execute(self.client.table('strategies').select('*').eq('user_id', user_id))
             return response.data or []
         except Exception as e:
             logger.error("Failed to get user strategies", user_id=user_id, error=str(e))
             return []
     
-    def get_marketplace_strategies(self) -> List[Dict[str, Any]]:
+    async def get_marketplace_strategies(self) -> List[Dict[str, Any]]:
         """Get public marketplace strategies"""
+        cached = await self._cache_lookup(MARKETPLACE_CACHE_KEY, MARKETPLACE_CACHE_TTL)
+        if cached is not None:
+            return [dict(strategy) for strategy in cached]
+        
+        strategies = await self._inflight.do(MARKETPLACE_CACHE_KEY, self._load_marketplace_strategies)
+        return [dict(strategy) for strategy in strategies]
+    
+    async def _load_marketplace_strategies(self) -> List[Dict[str, Any]]:
         try:
-            response = self.client.table('strategies').select('*').eq('is_public', True).eq('strategy_type', 'marketplace').execute()
-            return response.data or []
+            response = await self._execute(
+                self.client.table('strategies').select(MARKETPLACE_STRATEGY_COLUMNS)
+                .eq('is_public', True).eq('strategy_type', 'marketplace')
+            )
+            strategies = response.data or []
+            await self._cache_store(MARKETPLACE_CACHE_KEY, strategies, MARKETPLACE_CACHE_TTL, MARKETPLACE_SHARED_TTL)
+            return strategies
         except Exception as e:
             logger.error("Failed to get marketplace strategies", error=str(e))
             return []
     
-    def get_strategy_by_id(self, strategy_id: str) -> Optional[Dict[str, Any]]:
+    async def get_strategy_by_id(self, strategy_id: str) -> Optional[Dict[str, Any]]:
         """Get strategy by ID"""
+        cache_key = f"strategy:{strategy_id}"
+        cached = self._read_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
+        strategy = await self._inflight.do(cache_key, lambda: self._load_strategy(strategy_id, cache_key))
+        return dict(strategy) if strategy else None
+    
+    async def _load_strategy(self, strategy_id: str, cache_key: str) -> Optional[Dict[str, Any]]:
         try:
-            response = self.client.table('strategies').select('*').eq('id', strategy_id).execute()
-            return response.data[0] if response.data else None
+            response = await self._execute(self.client.table('strategies').select('*').eq('id', strategy_id))
+            if not response.data:
+                return None
+            self._read_cache.set(cache_key, response.data[0], ttl=STRATEGY_CACHE_TTL)
+            return response.data[0]
         except Exception as e:
             logger.error("Failed to get strategy by ID", strategy_id=strategy_id, error=str(e))
             return None
     
-    def create_strategy(self, strategy_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def get_strategies_by_ids(self, strategy_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several strategies in one query, keyed by strategy ID"""
+        try:
+            response = await self._execute(self.client.table('strategies').select('*').in_('id', strategy_ids))
+            return {strategy['id']: strategy for strategy in response.data or []}
+        except Exception as e:
+            logger.error("Failed to get strategies by IDs", count=len(strategy_ids), error=str(e))
+            return {}
+    
+    async def create_strategy(self, strategy_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create new strategy"""
+        self._read_cache.delete(MARKETPLACE_CACHE_KEY)
         try:
-            response = self.client.table('strategies').insert(strategy_data).execute()
+            response = await self._execute(self.client.table('strategies').insert(strategy_data))
+            await self._invalidate_shared(MARKETPLACE_CACHE_KEY)
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error("Failed to create strategy", error=str(e))
             return None
     
-    def update_strategy(self, strategy_id: str, user_id: str, strategy_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def update_strategy(self, strategy_id: str, user_id: str, strategy_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update strategy"""
+        self._invalidate_strategy(strategy_id)
         try:
-            response = self.client.table('strategies').update(strategy_data).eq('id', strategy_id).eq('user_id', user_id).execute()
+            response = await self._execute(self.client.table('strategies').update(strategy_data).eq('id', strategy_id).eq('user_id', user_id))
+            await self._invalidate_shared(f"strategy:{strategy_id}", MARKETPLACE_CACHE_KEY)
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error("Failed to update strategy", strategy_id=strategy_id, error=str(e))
             return None
     
-    def delete_strategy(self, strategy_id: str, user_id: str) -> bool:
+    async def delete_strategy(self, strategy_id: str, user_id: str) -> bool:
         """Delete strategy"""
+        self._invalidate_strategy(strategy_id)
         try:
-            response = self.client.table('strategies').delete().eq('id', strategy_id).eq('user_id', user_id).execute()
+            response = await self._execute(self.client.table('strategies').delete().eq('id', strategy_id).eq('user_id', user_id))
+            await self._invalidate_shared(f"strategy:{strategy_id}", MARKETPLACE_CACHE_KEY)
             return len(response.data) > 0
         except Exception as e:
             logger.error("Failed to delete strategy", strategy_id=strategy_id, error=str(e))
             return False
     
-    def get_bot_trades(self, bot_id: str, user_id: str, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get trades for a specific bot"""
+    async def get_recent_bot_trades(self, bot_id: str, user_id: str, limit: int, columns: str = '*') -> List[Dict[str, Any]]:
+        """Get the newest `limit` trades for a specific bot (aggregates belong in get_bot_trade_stats)"""
         try:
-            response = self.client.table('trades').select('*').eq('bot_id', bot_id).eq('user_id', user_id).order('created_at', desc=True).limit(limit).execute()
+            response = await self._execute(self.client.table('trades').select(columns).eq('bot_id', bot_id).eq('user_id', user_id).order('created_at', desc=True).limit(limit))
             return response.data or []
         except Exception as e:
-            logger.error("Failed to get bot trades", bot_id=bot_id, error=str(e))
+            logger.error("Failed to get recent bot trades", bot_id=bot_id, error=str(e))
             return []
     
-    def create_trade(self, trade_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Create new trade"""
+    async def stream_user_trades(
+        self, user_id: str, bot_id: Optional[str] = None, page_size: int = 500, columns: str = '*'
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield a user's trades, newest first, fetching keyset pages on (created_at, id)"""
+        cursor = None
+        while True:
+            query = self.client.table('trades').select(columns).eq('user_id', user_id)
+            if bot_id:
+                query = query.eq('bot_id', bot_id)
+            if cursor:
+                created_at, trade_id = cursor
+                query = query.or_(f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt.{trade_id})')
+            query = query.order('created_at', desc=True).order('id', desc=True).limit(page_size)
+            try:
+                response = await self._execute(query)
+            except Exception as e:
+                logger.error("Failed to stream user trades", user_id=user_id, bot_id=bot_id, error=str(e))
+                if cursor is None:
+                    return
+                # Rows were already sent; abort the stream rather than end it looking complete
+                raise
+            
+            rows = response.data or []
+            for row in rows:
+                yield row
+            
+            if len(rows) < page_size:
+                return
+            cursor = (rows[-1]['created_at'], rows[-1]['id'])
+    
+    async def get_bot_trade_stats(self, bot_id: str, user_id: str, since: datetime) -> Optional[Dict[str, Any]]:
+        """Get trade count/profit for a bot since a cutoff and its last trade time, aggregated in SQL"""
         try:
-            response = self.client.table('trades').insert(trade_data).execute()
+            response = await self._execute(self.privileged_client.rpc('get_bot_trade_summary', {
+                'p_bot_id': bot_id,
+                'p_user_id': user_id,
+                'p_since': since.isoformat()
+            }))
             return response.data[0] if response.data else None
+        except Exception as e:
+            logger.error("Failed to get bot trade stats", bot_id=bot_id, error=str(e))
+            return None
+    
+    async def get_trade_statistics(
+        self, user_id: str, bot_id: Optional[str] = None, status: Optional[str] = None, side: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get win/loss, profit, size, holding-time and streak aggregates for a user's trades, computed in SQL"""
+        try:
+            response = await self._execute(self.privileged_client.rpc('get_trade_statistics', {
+                'p_user_id': user_id,
+                'p_bot_id': bot_id,
+                'p_status': status,
+                'p_side': side
+            }))
+            return response.data[0] if response.data else None
+        except Exception as e:
+            logger.error("Failed to get trade statistics", user_id=user_id, bot_id=bot_id, error=str(e))
+            return None
+    
+    async def create_trade(self, trade_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Create new trade"""
+        try:
+            response = await self._execute(self.client.rpc('record_trade', {'p_trade': trade_data}))
+            trade = response.data[0] if response.data else None
+            if trade and trade.get('bot_id'):
+                await cache_delete(bot_status_key(trade['bot_id']))
+            return trade
         except Exception as e:
             logger.error("Failed to create trade", error=str(e))
             return None
     
-    def update_trade(self, trade_id: str, trade_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def create_trades_bulk(self, trades: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert several trades in one request and statement"""
+        if not trades:
+            return []
+        try:
+            response = await self._execute(self.client.table('trades').insert(trades))
+            bot_ids = {trade['bot_id'] for trade in response.data or [] if trade.get('bot_id')}
+            await cache_delete(*(bot_status_key(bot_id) for bot_id in bot_ids))
+            return response.data or []
+        except Exception as e:
+            logger.error("Failed to create trades", count=len(trades), error=str(e))
+            return []
+    
+    async def update_trade(self, trade_id: str, trade_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update trade"""
         try:
-            response = self.client.table('trades').update(trade_data).eq('id', trade_id).execute()
-            return response.data[0] if response.data else None
+            response = await self._execute(self.client.table('trades').update(trade_data).eq('id', trade_id))
+            trade = response.data[0] if response.data else None
+            if trade and trade.get('bot_id'):
+                await cache_delete(bot_status_key(trade['bot_id']))
+            return trade
         except Exception as e:
             logger.error("Failed to update trade", trade_id=trade_id, error=str(e))
             return None
     
-    def create_ai_analysis(self, analysis_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def create_ai_analysis(self, analysis_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create AI analysis record"""
         try:
-            response = self.client.table('ai_analyses').insert(analysis_data).execute()
+            response = await self._execute(self.client.table('ai_analyses').insert(analysis_data))
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error("Failed to create AI analysis", error=str(e))
             return None
     
-    def create_backtest_result(self, result_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def create_ai_analysis_if_owned(self, user_id: str, bot_id: str, analysis_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Create AI analysis record if the bot belongs to the user (single round-trip)"""
+        try:
+            response = await self._execute(self.privileged_client.rpc('create_ai_analysis_if_owned', {
+                'p_user_id': user_id,
+                'p_bot_id': bot_id,
+                'p_payload': analysis_data
+            }))
+            return response.data[0] if response.data else None
+        except Exception as e:
+            logger.error("Failed to create AI analysis", bot_id=bot_id, user_id=user_id, error=str(e))
+            return None
+    
+    async def stream_ai_analyses(
+        self, bot_id: str, user_id: str, analysis_type: Optional[str] = None, page_size: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield AI analyses for a bot, newest first, fetching one page at a time"""
+        offset = 0
+        while True:
+            query = self.client.table('ai_analyses').select('*').eq('bot_id', bot_id).eq('user_id', user_id)
+            if analysis_type:
+                query = query.eq('analysis_type', analysis_type)
+            query = query.order('created_at', desc=True).range(offset, offset + page_size - 1)
+            try:
+                response = await self._execute(query)
+            except Exception as e:
+                logger.error("Failed to stream AI analyses", bot_id=bot_id, offset=offset, error=str(e))
+                return
+            
+            rows = response.data or []
+            for row in rows:
+                yield row
+            
+            if len(rows) < page_size:
+                return
+            offset += page_size
+    
+    async def get_ai_usage_stats(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Get aggregated AI usage statistics for a user"""
+        try:
+            response = await self._execute(self.privileged_client.rpc('get_ai_usage_stats', {'uid': user_id}))
+            return response.data
+        except Exception as e:
+            logger.error("Failed to get AI usage stats", user_id=user_id, error=str(e))
+            return None
+    
+    async def create_backtest_result(self, result_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create backtest result"""
         try:
-            response = self.client.table('backtest_results').insert(result_data).execute()
+            response = await self._execute(self.client.table('backtest_results').insert(result_data))
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error("Failed to create backtest result", error=str(e))
             return None
     
-    def create_log(self, log_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def create_log(self, log_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create log entry"""
         try:
-            response = self.client.table('logs').insert(log_data).execute()
+            response = await self._execute(self.client.table('logs').insert(log_data))
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error("Failed to create log", error=str(e))
             return None
     
-    def get_user_logs(self, user_id: str, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get logs for a user"""
+    async def create_logs_bulk(self, logs: List[Dict[str, Any]]) -> bool:
+        """Insert several log entries in one request; rows should share the same keys"""
+        if not logs:
+            return True
         try:
-            response = self.client.table('logs').select('*').eq('user_id', user_id).order('created_at', desc=True).limit(limit).execute()
+            await self._execute(self.client.table('logs').insert(logs, returning=ReturnMethod.minimal))
+            return True
+        except Exception as e:
+            logger.error("Failed to create logs", count=len(logs), error=str(e))
+            return False
+    
+    async def get_user_logs(
+        self, user_id: str, limit: int = 100, before: Optional[Tuple[str, str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get logs for a user, newest first; pass the last row's (created_at, id) as before for the next page"""
+        try:
+            query = self.client.table('logs').select('*').eq('user_id', user_id)
+            if before:
+                # Keyset on (created_at, id) so rows sharing the boundary timestamp aren't skipped
+                created_at, log_id = before
+                query = query.or_(f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt.{log_id})')
+            query = query.order('created_at', desc=True).order('id', desc=True).limit(limit)
+            response = await self._execute(query)
             return response.data or []
         except Exception as e:
             logger.error("Failed to get user logs", user_id=user_id, error=str(e))
             return []
     
-    def execute_rpc(self, function_name: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+    async def _gather_bounded(self, *aws, limit: int = FANOUT_CONCURRENCY) -> List[Any]:
+        """asyncio.gather with at most `limit` of the given queries in flight"""
+        semaphore = asyncio.Semaphore(limit)
+        
+        async def run(aw):
+            async with semaphore:
+                return await aw
+        
+        return await asyncio.gather(*(run(aw) for aw in aws))
+    
+    async def get_user_dashboard_bundle(self, user_id: str, logs_limit: int = 50) -> Dict[str, List[Dict[str, Any]]]:
+        """Get a user's bots, strategies and recent logs with the queries issued concurrently"""
+        bots, strategies, logs = await self._gather_bounded(
+            self.get_user_bots(user_id),
+            self.get_user_strategies(user_id),
+            self.get_user_logs(user_id, limit=logs_limit)
+        )
+        return {"bots": bots, "strategies": strategies, "logs": logs}
+    
+    async def execute_rpc(self, function_name: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
         """Execute PostgreSQL function"""
         try:
             if params:
-                response = self.client.rpc(function_name, params).execute()
+                response = await self._execute(self.client.rpc(function_name, params))
             else:
-                response = self.client.rpc(function_name).execute()
+                response = await self._execute(self.client.rpc(function_name))
             return response.data
         except Exception as e:
             logger.error("Failed to execute RPC", function=function_name, error=str(e))
             return None
     
-    def health_check(self) -> Dict[str, Any]:
+    async def health_check(self) -> Dict[str, Any]:
         """Check database health"""
+        start_ns = time.perf_counter_ns()
         try:
-            start_time = datetime.now()
-            self.client.table('users').select('count').limit(1).execute()
-            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            await self._execute(self.client.table('users').select('count').limit(1))
+            response_time = (time.perf_counter_ns() - start_ns) / 1e6
             
             return {
                 "status": "healthy",
                 "response_time_ms": round(response_time, 2),
                 "connected": True,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now(timezone.utc).isoformat()
             }
         except Exception as e:
             logger.error("Database health check failed", error=str(e))
@@ -257,16 +727,33 @@ class SupabaseClient:
                 "response_time_ms": None,
                 "connected": False,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now(timezone.utc).isoformat()
             }
 
 
 # Global database client instance
 db_client: Optional[SupabaseClient] = None
+_db_client_lock = threading.Lock()
 
 def get_db_client() -> SupabaseClient:
-    """Get database client instance"""
+    """Get database client instance, created once per process even if first calls race"""
     global db_client
     if db_client is None:
-        db_client = SupabaseClient()
+        with _db_client_lock:
+            if db_client is None:
+                db_client = SupabaseClient()
     return db_client
+
+
+def evict_cached(keys: Iterable[str]):
+    """Evict read-cache keys in this worker, if the database client has been created"""
+    if db_client is not None:
+        db_client.evict_local(keys)
+
+
+async def close_db_client():
+    """Close the database client's HTTP sessions if it was created"""
+    global db_client
+    if db_client is not None:
+        await db_client.close()
+        db_client = None
@@ -0,0 +1,49 @@
+"""
+Request-scoped batch loading for NusaNexus NoFOMO
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List
+
+
+class DataLoader:
+    """Coalesces load(key) calls made in the same event-loop tick into one batch query"""
+
+    def __init__(self, batch_load_fn: Callable[[List[str]], Awaitable[Dict[str, Any]]]):
+        # batch_load_fn maps a list of keys to {key: value}; missing keys load as None
+        self._batch_load_fn = batch_load_fn
+        self._futures: Dict[str, asyncio.Future] = {}
+        self._pending: List[str] = []
+
+    def load(self, key: str) -> "asyncio.Future":
+        """Schedule key for the next batch; repeated keys share one result"""
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            if not self._pending:
+                # Dispatch once the current tick's callers have all queued their keys
+                loop.call_soon(lambda: asyncio.ensure_future(self._dispatch()))
+            self._pending.append(key)
+        return future
+
+    async def load_many(self, keys: List[str]) -> List[Any]:
+        """Load several keys in a single batch"""
+        return await asyncio.gather(*(self.load(key) for key in keys))
+
+    async def _dispatch(self):
+        keys, self._pending = self._pending, []
+        try:
+            results = await self._batch_load_fn(keys)
+        except Exception as e:
+            for key in keys:
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key in keys:
+            future = self._futures[key]
+            if not future.done():
+                future.set_result(results.get(key))
@@ -0,0 +1,104 @@
+"""
+Redis client and cache helpers for NusaNexus NoFOMO
+"""
+
+import time
+from typing import Optional
+import redis.asyncio as aioredis
+import structlog
+
+from .config import settings
+
+logger = structlog.get_logger()
+
+# Seconds to skip Redis after a failure so an outage doesn't add latency to every request
+RETRY_AFTER_SECONDS = 30
+
+# Pub/sub channel carrying JSON lists of read-cache keys that peer workers should evict
+CACHE_INVALIDATION_CHANNEL = "cache:invalidate"
+
+_redis: Optional[aioredis.Redis] = None
+_disabled_until: float = 0.0
+
+
+def get_redis() -> Optional[aioredis.Redis]:
+    """Get shared Redis client, or None while Redis is marked unavailable"""
+    global _redis
+    if time.monotonic() < _disabled_until:
+        return None
+    if _redis is None:
+        _redis = aioredis.from_url(
+            settings.redis_url,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5
+        )
+    return _redis
+
+
+def _mark_unavailable(operation: str, error: Exception):
+    global _disabled_until
+    _disabled_until = time.monotonic() + RETRY_AFTER_SECONDS
+    logger.warning("Redis unavailable, bypassing cache", operation=operation, error=str(error))
+
+
+def bot_status_key(bot_id: str) -> str:
+    """Cache key for a bot's polled status payload"""
+    return f"bot:{bot_id}:status"
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Get cached bytes, or None on miss / Redis failure"""
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        return await client.get(key)
+    except Exception as e:
+        _mark_unavailable("get", e)
+        return None
+
+
+async def cache_set(key: str, value: bytes, ttl: int):
+    """Store bytes under key with a TTL in seconds; failures are ignored"""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        await client.set(key, value, ex=ttl)
+    except Exception as e:
+        _mark_unavailable("set", e)
+
+
+async def cache_delete(*keys: str):
+    """Delete cached keys; failures are ignored"""
+    client = get_redis()
+    if client is None or not keys:
+        return
+    try:
+        await client.delete(*keys)
+    except Exception as e:
+        _mark_unavailable("delete", e)
+
+
+async def cache_publish(channel: str, message: bytes):
+    """Publish a message; failures are ignored"""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        await client.publish(channel, message)
+    except Exception as e:
+        _mark_unavailable("publish", e)
+
+
+def create_subscriber() -> aioredis.Redis:
+    """Dedicated connection for pub/sub; no socket timeout since it blocks waiting for messages"""
+    return aioredis.from_url(settings.redis_url, socket_connect_timeout=0.5)
+
+
+async def close_redis():
+    """Close the shared Redis connection pool"""
+    global _redis
+    if _redis is not None:
+        await _redis.close()
+        _redis = None
@@ -0,0 +1,32 @@
+"""
+JSON response class for NusaNexus NoFOMO
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any
+
+from fastapi.responses import ORJSONResponse as _BaseORJSONResponse
+import orjson
+
+
+def _default(value: Any) -> Any:
+    """Encode the types orjson has no native support for"""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONResponse(_BaseORJSONResponse):
+    """orjson response that also encodes Decimal, timedelta, sets and numpy arrays"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
@@ -84,7 +84,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         self.jwt_algorithm = "HS256"
     
     async def dispatch(self, request: Request, call_next) -> Response:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         client_ip = self._get_client_ip(request)
         user_agent = request.headers.get("user-agent", "")
         
@@ -133,7 +133,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             response = self._add_security_headers(response, request)
             
             # Log security events
-            processing_time = time.time() - start_time
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e9
             logger.info("Request processed", 
                        ip=client_ip, 
                        path=request.url.path, 
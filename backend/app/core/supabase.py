@@ -48,11 +48,9 @@ class SupabaseClient:
                     supabase_key=settings.supabase_key
                 )
             
-            # Service role client (for admin operations)
-            self._service_client = create_client(
-                supabase_url=settings.supabase_url,
-                supabase_key=settings.supabase_service_role_key
-            )
+            # Service role client is token independent; build it once and keep
+            # its HTTP connection pool warm across requests
+            self.init_service_client()
             
             logger.info("Supabase clients initialized successfully")
             
@@ -60,10 +58,18 @@ class SupabaseClient:
             logger.error("Failed to initialize Supabase clients", error=str(e))
             raise
     
+    def init_service_client(self) -> Client:
+        """Create the service role client on first use and reuse it afterwards"""
+        if self._service_client is None:
+            self._service_client = create_client(
+                supabase_url=settings.supabase_url,
+                supabase_key=settings.supabase_service_role_key
+            )
+        return self._service_client
+    
     def reset(self):
-        """Reset clients (for logout)"""
+        """Reset user client (for logout); the shared service client is kept"""
         self._client = None
-        self._service_client = None
         logger.info("Supabase clients reset")
 
 
@@ -74,8 +80,10 @@ supabase_client = SupabaseClient()
 class AuthService:
     """Supabase authentication service"""
     
-    def __init__(self):
-        self.client = supabase_client.service_client
+    @property
+    def client(self) -> Client:
+        """Shared service role client, created lazily on first auth call"""
+        return supabase_client.init_service_client()
     
     async def register_user(
         self, 
@@ -2,17 +2,13 @@
 AI Pydantic models for NusaNexus NoFOMO
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Literal, Optional, Dict, Any, List
 from pydantic import BaseModel, Field, ConfigDict
-from datetime import datetime, timezone
-from .common import AnalysisType, RiskLevel, SideType, StrategyType, TimeFrame
-
-
-def _utcnow() -> datetime:
-    return datetime.now(timezone.utc)
+from datetime import datetime
+from .common import AnalysisType, FastModel, RiskLevel, SideType, StrategyType, TimeFrame, utcnow
 
 # AI Analysis Base Model
-class AIAnalysisBase(BaseModel):
+class AIAnalysisBase(FastModel):
     model_config = ConfigDict(protected_namespaces=())
     
     analysis_type: AnalysisType
@@ -41,7 +37,7 @@ class StrategyGenerationRequest(BaseModel):
     timeframe: TimeFrame
     risk_level: RiskLevel = RiskLevel.MEDIUM
     strategy_type: StrategyType = StrategyType.AI_GENERATED
-    style: str = Field("conservative", regex="^(conservative|balanced|aggressive)$")
+    style: Literal["conservative", "balanced", "aggressive"] = "conservative"
     max_parameters: int = Field(10, ge=1, le=50)
     include_stop_loss: bool = True
     include_take_profit: bool = True
@@ -127,6 +123,25 @@ class AITradeSignal(BaseModel):
     expires_at: datetime
 
 
+# AI Signal Analysis Request
+class SignalAnalysisRequest(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    
+    symbol: str
+    signal_type: str
+    price: float
+    timeframe: str
+
+
+# AI Backtest Analysis Request
+class BacktestAnalysisRequest(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    
+    strategy_name: str
+    trading_pair: str
+    results: Dict[str, Any]
+
+
 # AI Chat Request
 class AIChatRequest(BaseModel):
     message: str = Field(..., min_length=1, max_length=2000)
@@ -155,7 +170,7 @@ class AIAnalysisQueue(BaseModel):
     priority: int = Field(1, ge=1, le=10)
     payload: Dict[str, Any]
     estimated_duration: int  # seconds
-    created_at: datetime = Field(default_factory=_utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
 
 
 # AI Model Status
@@ -4,7 +4,8 @@ Authentication Pydantic models for NusaNexus NoFOMO
 
 from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field
-from datetime import datetime, timezone
+from datetime import datetime
+from .common import utcnow
 from .user import UserResponse
 
 
@@ -109,6 +110,11 @@ class OAuthCallback(BaseModel):
     state: Optional[str] = None
 
 
+class OAuthCodeExchange(BaseModel):
+    code: str = Field(..., min_length=1)
+    code_verifier: str = Field(..., min_length=1)
+
+
 # Security Models
 class SecuritySettings(BaseModel):
     two_factor_enabled: bool = False
@@ -119,13 +125,9 @@ class SecuritySettings(BaseModel):
     login_notifications: bool = True
 
 
-def _utcnow() -> datetime:
-    return datetime.now(timezone.utc)
-
-
 class LoginAttempt(BaseModel):
     ip_address: str
     user_agent: str
     success: bool
     failure_reason: Optional[str] = None
-    timestamp: datetime = Field(default_factory=_utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
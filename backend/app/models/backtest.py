@@ -2,10 +2,11 @@
 Backtest Pydantic models for NusaNexus NoFOMO
 """
 
-from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from typing import Annotated, Literal, Optional, Dict, Any, List
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, PlainSerializer
 from datetime import datetime
-from .common import SideType, TimeFrame
+import numpy as np
+from .common import FastModel, SideType, TimeFrame
 
 
 # Backtest Configuration
@@ -27,7 +28,7 @@ class BacktestConfig(BaseModel):
 
 
 # Backtest Result Response
-class BacktestResultResponse(BaseModel):
+class BacktestResultResponse(FastModel):
     id: str
     strategy_id: str
     user_id: str
@@ -85,16 +86,34 @@ class BacktestTrade(BaseModel):
     balance_after: float
 
 
+# Per-bar chart series: one contiguous float64 array instead of a list of Python floats
+# (float32 keeps only ~7 significant digits, which corrupts balances in the JSON output)
+FloatSeries = Annotated[
+    np.ndarray,
+    BeforeValidator(lambda value: np.asarray(value, dtype=np.float64)),
+    PlainSerializer(lambda series: series.tolist(), return_type=List[float], when_used="json")
+]
+
+
 # Backtest Chart Data
 class BacktestChartData(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     timestamps: List[datetime]
-    equity: List[float]
-    balance: List[float]
-    profit_loss: List[float]
-    drawdown: List[float]
+    equity: FloatSeries
+    balance: FloatSeries
+    profit_loss: FloatSeries
+    drawdown: FloatSeries
     trades: List[Dict[str, Any]]
     signals: Optional[List[Dict[str, Any]]] = None
 
+    def max_drawdown(self) -> float:
+        """Largest peak-to-trough equity decline, as a percentage of the peak"""
+        if not self.equity.size:
+            return 0.0
+        peaks = np.maximum.accumulate(self.equity)
+        return float(np.max((peaks - self.equity) / np.where(peaks > 0, peaks, 1)) * 100)
+
 
 # Backtest Comparison
 class BacktestComparison(BaseModel):
@@ -114,7 +133,7 @@ class BacktestOptimizationRequest(BaseModel):
     trading_pair: str
     timeframe: TimeFrame
     parameter_ranges: Dict[str, Any]  # {"param1": [min, max], "param2": [min, max]}
-    optimization_metric: str = Field("total_return", regex="^(total_return|sharpe_ratio|win_rate|profit_factor)$")
+    optimization_metric: Literal["total_return", "sharpe_ratio", "win_rate", "profit_factor"] = "total_return"
     max_iterations: int = Field(100, ge=10, le=1000)
     parallelism: int = Field(1, ge=1, le=8)
 
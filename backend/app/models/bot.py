@@ -2,7 +2,7 @@
 Bot Pydantic models for NusaNexus NoFOMO
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Literal, Optional, Dict, Any, List
 from pydantic import BaseModel, Field
 from datetime import datetime
 from .common import BotStatus, ExchangeType, TimeFrame
@@ -94,7 +94,7 @@ class BotPerformance(BaseModel):
 
 # Bot Control Actions
 class BotAction(BaseModel):
-    action: str = Field(..., regex="^(start|stop|pause|resume|reset)$")
+    action: Literal["start", "stop", "pause", "resume", "reset"]
 
 
 # Bot Configuration
@@ -2,8 +2,8 @@
 Common Pydantic models for NusaNexus NoFOMO
 """
 
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Annotated, Literal, Optional, List, Dict, Any, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from datetime import datetime, timezone
 from enum import Enum
 
@@ -87,14 +87,21 @@ class AnalysisType(str, Enum):
     BACKTEST = "backtest"
 
 
+# Base for response models built from database rows on hot paths
+class FastModel(BaseModel):
+    # Rows carry columns a response doesn't expose; drop them instead of failing. Defaults are
+    # trusted as written rather than re-validated on every construction
+    model_config = ConfigDict(extra="ignore", validate_assignment=False, validate_default=False)
+
+
 # API Response Models
-class APIResponse(BaseModel):
+class APIResponse(FastModel):
     success: bool = True
     message: str = "Success"
     data: Optional[Dict[str, Any]] = None
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(FastModel):
     success: bool = False
     error: str
     message: str
@@ -106,10 +113,10 @@ class PaginationParams(BaseModel):
     page: int = Field(1, ge=1, description="Page number")
     limit: int = Field(20, ge=1, le=100, description="Items per page")
     sort_by: Optional[str] = Field(None, description="Field to sort by")
-    sort_order: str = Field("desc", regex="^(asc|desc)$", description="Sort order")
+    sort_order: Literal["asc", "desc"] = Field("desc", description="Sort order")
 
 
-class PaginatedResponse(BaseModel):
+class PaginatedResponse(FastModel):
     data: List[Any]
     total: int
     page: int
@@ -119,36 +126,68 @@ class PaginatedResponse(BaseModel):
     has_prev: bool
 
 
-# WebSocket Models
-def _utcnow() -> datetime:
+# Shared by the timestamped models here and in auth/ai
+def utcnow() -> datetime:
+    """Timezone-aware current UTC time; default factory for model timestamps"""
     return datetime.now(timezone.utc)
 
 
+# WebSocket Models
+
+
 class WebSocketMessage(BaseModel):
     type: str
     data: Dict[str, Any]
-    timestamp: datetime = Field(default_factory=_utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
 
 
 class BotStatusUpdate(WebSocketMessage):
-    type: str = "bot_status"
-    data: Dict[str, Any] = {}
+    type: Literal["bot_status"] = "bot_status"
+    data: Dict[str, Any] = Field(default_factory=dict)
 
 
 class TradeUpdate(WebSocketMessage):
-    type: str = "trade_update"
-    data: Dict[str, Any] = {}
+    type: Literal["trade_update"] = "trade_update"
+    data: Dict[str, Any] = Field(default_factory=dict)
 
 
 class MarketDataUpdate(WebSocketMessage):
-    type: str = "market_data"
-    data: Dict[str, Any] = {}
+    type: Literal["market_data"] = "market_data"
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+
+class ErrorUpdate(WebSocketMessage):
+    type: Literal["error"] = "error"
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+
+class AIInsightUpdate(WebSocketMessage):
+    type: Literal["ai_insight"] = "ai_insight"
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+
+class SystemAlertUpdate(WebSocketMessage):
+    type: Literal["system_alert"] = "system_alert"
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+
+# Tagged on "type", so serialization jumps straight to the matching model
+WSMessage = Annotated[
+    Union[BotStatusUpdate, TradeUpdate, MarketDataUpdate, ErrorUpdate, AIInsightUpdate, SystemAlertUpdate],
+    Field(discriminator="type")
+]
+_WSMessageAdapter = TypeAdapter(WSMessage)
+
+
+def dump_ws_message(message: WSMessage) -> bytes:
+    """Serialize any WebSocket message model to JSON bytes"""
+    return _WSMessageAdapter.dump_json(message)
 
 
 # Health Check Models
-class HealthStatus(BaseModel):
+class HealthStatus(FastModel):
     status: str
-    timestamp: datetime = Field(default_factory=_utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
     version: str
     services: Dict[str, str]
 
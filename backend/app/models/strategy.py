@@ -2,10 +2,10 @@
 Strategy Pydantic models for NusaNexus NoFOMO
 """
 
-from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from typing import Literal, Optional, Dict, Any, List
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import datetime
-from .common import RiskLevel, StrategyType
+from .common import FastModel, RiskLevel, StrategyType
 
 
 # Base Strategy Model
@@ -23,7 +23,7 @@ class StrategyBase(BaseModel):
 
 
 # Strategy Response Model
-class StrategyResponse(StrategyBase):
+class StrategyResponse(StrategyBase, FastModel):
     id: str
     user_id: str
     performance: Dict[str, Any] = Field(default_factory=dict)
@@ -32,6 +32,15 @@ class StrategyResponse(StrategyBase):
     updated_at: datetime
 
 
+# Built once at import; reused by every list validation instead of per-row models
+_StrategyListAdapter = TypeAdapter(List[StrategyResponse])
+
+
+def validate_strategies(rows: List[Dict[str, Any]]) -> List[StrategyResponse]:
+    """Validate a list of strategy rows in one call"""
+    return _StrategyListAdapter.validate_python(rows)
+
+
 # Strategy Creation Model
 class StrategyCreate(StrategyBase):
     pass
@@ -50,7 +59,7 @@ class StrategyUpdate(BaseModel):
 
 
 # Strategy Marketplace Item
-class StrategyMarketplaceItem(BaseModel):
+class StrategyMarketplaceItem(FastModel):
     id: str
     name: str
     description: str
@@ -66,7 +75,7 @@ class StrategyMarketplaceItem(BaseModel):
 
 
 # Strategy Performance
-class StrategyPerformance(BaseModel):
+class StrategyPerformance(FastModel):
     strategy_id: str
     total_returns: float
     total_returns_percentage: float
@@ -113,12 +122,12 @@ class StrategySearch(BaseModel):
     category: Optional[str] = None
     tags: Optional[List[str]] = None
     is_verified: Optional[bool] = None
-    sort_by: str = "created_at"
-    sort_order: str = "desc"
+    sort_by: Literal["created_at", "updated_at", "name", "risk_level", "category"] = "created_at"
+    sort_order: Literal["asc", "desc"] = "desc"
 
 
 # Strategy List Response
-class StrategyListResponse(BaseModel):
+class StrategyListResponse(FastModel):
     strategies: List[StrategyResponse]
     total: int
     performance_summary: StrategyPerformance
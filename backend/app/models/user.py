@@ -62,7 +62,7 @@ class UserProfile(BaseModel):
     full_name: str
     avatar_url: Optional[str]
     subscription_plan: str
-    created_at: datetime
+    created_at: Optional[datetime] = None  # Not carried in access token claims
     last_login_at: Optional[datetime] = None
     stats: Optional[Dict[str, Any]] = None
 
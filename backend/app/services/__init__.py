@@ -3,7 +3,10 @@ Services package for NusaNexus NoFOMO
 """
 
 from .ai_service import AIService
-from .other_services import BotService, ExchangeService, EncryptionService, NotificationService
+from .other_services import BotService, ExchangeService
+# Real implementations; their factories return the module-level singletons
+from .encryption import EncryptionService, get_encryption_service
+from .notification import NotificationService, get_notification_service
 
 # Service factory functions
 def get_ai_service() -> AIService:
@@ -16,12 +19,4 @@ def get_bot_service() -> BotService:
 
 def get_exchange_service() -> ExchangeService:
     """Get exchange service instance"""
-    return ExchangeService()
-
-def get_encryption_service() -> EncryptionService:
-    """Get encryption service instance"""
-    return EncryptionService()
-
-def get_notification_service() -> NotificationService:
-    """Get notification service instance"""
-    return NotificationService()
\ No newline at end of file
+    return ExchangeService()
\ No newline at end of file
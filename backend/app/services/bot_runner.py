@@ -26,11 +26,11 @@ class BotRunnerService:
         self.base_dir = Path("/app/bots")
         self.base_dir.mkdir(exist_ok=True)
     
-    def start_bot(self, bot_id: str, user_id: str, config: Dict[str, Any]) -> bool:
+    async def start_bot(self, bot_id: str, user_id: str, config: Dict[str, Any]) -> bool:
         """Start a trading bot"""
         try:
             # Get bot data from database
-            bot_data = self.db_client.get_bot_by_id(bot_id, user_id)
+            bot_data = await self.db_client.get_bot_by_id(bot_id, user_id)
             if not bot_data:
                 raise ValueError(f"Bot {bot_id} not found for user {user_id}")
             
@@ -79,7 +79,7 @@ class BotRunnerService:
             self.bot_processes[bot_id] = process
             
             # Update bot status in database
-            self.db_client.update_bot(bot_id, user_id, {
+            await self.db_client.update_bot(bot_id, user_id, {
                 "status": "running",
                 "last_trade_at": datetime.utcnow().isoformat()
             })
@@ -90,13 +90,13 @@ class BotRunnerService:
         except Exception as e:
             logger.error("Failed to start bot", bot_id=bot_id, error=str(e))
             # Update bot status to error
-            self.db_client.update_bot(bot_id, user_id, {
+            await self.db_client.update_bot(bot_id, user_id, {
                 "status": "error",
                 "error_message": str(e)
             })
             return False
     
-    def stop_bot(self, bot_id: str, user_id: str) -> bool:
+    async def stop_bot(self, bot_id: str, user_id: str) -> bool:
         """Stop a trading bot"""
         try:
             if bot_id not in self.bot_processes:
@@ -120,7 +120,7 @@ class BotRunnerService:
                 del self.bot_configs[bot_id]
             
             # Update bot status
-            self.db_client.update_bot(bot_id, user_id, {
+            await self.db_client.update_bot(bot_id, user_id, {
                 "status": "stopped"
             })
             
@@ -156,7 +156,7 @@ class BotRunnerService:
             logger.error("Failed to get bot status", bot_id=bot_id, error=str(e))
             return {"status": "error", "error": str(e)}
     
-    def pause_bot(self, bot_id: str, user_id: str) -> bool:
+    async def pause_bot(self, bot_id: str, user_id: str) -> bool:
         """Pause a running bot"""
         try:
             if bot_id not in self.bot_processes:
@@ -165,7 +165,7 @@ class BotRunnerService:
             
             # For Freqtrade, we'll just update the status
             # In a real implementation, you might want to send a pause signal
-            self.db_client.update_bot(bot_id, user_id, {
+            await self.db_client.update_bot(bot_id, user_id, {
                 "status": "paused"
             })
             
@@ -176,10 +176,10 @@ class BotRunnerService:
             logger.error("Failed to pause bot", bot_id=bot_id, error=str(e))
             return False
     
-    def resume_bot(self, bot_id: str, user_id: str) -> bool:
+    async def resume_bot(self, bot_id: str, user_id: str) -> bool:
         """Resume a paused bot"""
         try:
-            self.db_client.update_bot(bot_id, user_id, {
+            await self.db_client.update_bot(bot_id, user_id, {
                 "status": "running"
             })
             
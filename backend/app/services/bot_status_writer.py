@@ -0,0 +1,130 @@
+"""
+Batched bot status writer for NusaNexus NoFOMO
+"""
+
+import asyncio
+from typing import List, Optional, Tuple
+import structlog
+
+from app.core.database import get_db_client
+
+logger = structlog.get_logger()
+
+# (bot_id, user_id, new_status, ack future)
+PendingTransition = Tuple[str, str, str, asyncio.Future]
+
+
+class BotStatusWriter:
+    """Buffers bot status transitions and writes them in one UPDATE per flush"""
+
+    def __init__(self, flush_interval: float = 0.1, max_batch: int = 100):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        # None is the stop sentinel
+        self._queue: "asyncio.Queue[Optional[PendingTransition]]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background flush loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("Bot status writer started")
+
+    async def stop(self):
+        """Stop the flush loop, writing out anything still queued"""
+        if self._task is None:
+            return
+        # New transitions write directly from here on; the loop finishes its
+        # current batch and everything queued ahead of the sentinel
+        task, self._task = self._task, None
+        await self._queue.put(None)
+        try:
+            await task
+        except Exception as e:
+            logger.error("Bot status writer loop failed", error=str(e))
+
+        leftover = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                leftover.append(item)
+        try:
+            for start in range(0, len(leftover), self.max_batch):
+                await self._flush(leftover[start:start + self.max_batch])
+        finally:
+            for _, _, _, future in leftover:
+                if not future.done():
+                    future.set_exception(RuntimeError("Bot status writer stopped"))
+        logger.info("Bot status writer stopped")
+
+    async def transition(self, bot_id: str, user_id: str, new_status: str) -> bool:
+        """Queue a status change and wait for it to be written; True if the status changed"""
+        if self._task is None:
+            # Not running (e.g. outside the app lifespan); write directly
+            updated = await get_db_client().transition_bot_status(bot_id, user_id, new_status)
+            return updated is not None
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((bot_id, user_id, new_status, future))
+        return await future
+
+    async def _run(self):
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                break
+            # Let a burst (e.g. "start all bots") accumulate before writing
+            await asyncio.sleep(self.flush_interval)
+            batch = self._drain([first])
+            stopping = None in batch
+            await self._flush([item for item in batch if item is not None])
+
+    def _drain(self, batch: List[Optional[PendingTransition]]) -> List[Optional[PendingTransition]]:
+        while len(batch) < self.max_batch and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _flush(self, batch: List[PendingTransition]):
+        # UPDATE ... FROM picks an arbitrary source row when a bot appears twice,
+        # so repeated transitions for the same bot go out in a follow-up write
+        current: List[PendingTransition] = []
+        deferred: List[PendingTransition] = []
+        seen = set()
+        for item in batch:
+            (deferred if item[0] in seen else current).append(item)
+            seen.add(item[0])
+
+        try:
+            changed = await get_db_client().transition_bot_statuses([
+                {"id": bot_id, "user_id": user_id, "status": new_status}
+                for bot_id, user_id, new_status, _ in current
+            ])
+        except Exception as e:
+            logger.error("Bot status flush failed", count=len(current), error=str(e))
+            changed = None
+
+        for bot_id, _, _, future in current:
+            if future.done():
+                continue
+            if changed is None:
+                future.set_exception(RuntimeError("Failed to write bot status"))
+            else:
+                future.set_result(bot_id in changed)
+
+        logger.debug("Flushed bot status transitions", count=len(current))
+
+        if deferred:
+            await self._flush(deferred)
+
+
+# Global bot status writer instance
+bot_status_writer: Optional[BotStatusWriter] = None
+
+
+def get_bot_status_writer() -> BotStatusWriter:
+    """Get bot status writer instance"""
+    global bot_status_writer
+    if bot_status_writer is None:
+        bot_status_writer = BotStatusWriter()
+    return bot_status_writer
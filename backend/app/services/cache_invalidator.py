@@ -0,0 +1,66 @@
+"""
+Cross-worker read-cache invalidation for NusaNexus NoFOMO
+"""
+
+import asyncio
+from typing import Optional
+import orjson
+import structlog
+
+from app.core.database import evict_cached
+from app.core.redis import CACHE_INVALIDATION_CHANNEL, RETRY_AFTER_SECONDS, create_subscriber
+
+logger = structlog.get_logger()
+
+
+class CacheInvalidationListener:
+    """Evicts this worker's in-process read-cache entries when another worker writes the rows"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start listening for invalidations"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("Cache invalidation listener started")
+
+    async def stop(self):
+        """Stop listening for invalidations"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        while True:
+            client = create_subscriber()
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        evict_cached(orjson.loads(message["data"]))
+            except Exception as e:
+                logger.warning("Cache invalidation listener disconnected", error=str(e))
+            finally:
+                await pubsub.close()
+                await client.close()
+            # Peers fall back to their short in-process TTLs until Redis is reachable again
+            await asyncio.sleep(RETRY_AFTER_SECONDS)
+
+
+# Global cache invalidation listener instance
+cache_invalidation_listener: Optional[CacheInvalidationListener] = None
+
+
+def get_cache_invalidation_listener() -> CacheInvalidationListener:
+    """Get cache invalidation listener instance"""
+    global cache_invalidation_listener
+    if cache_invalidation_listener is None:
+        cache_invalidation_listener = CacheInvalidationListener()
+    return cache_invalidation_listener
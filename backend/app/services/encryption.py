@@ -2,17 +2,31 @@
 Encryption service for secure storage of API keys and sensitive data
 """
 
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Union
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
+import hashlib
 import os
 import structlog
 from app.core.config import settings
 
 logger = structlog.get_logger()
 
+KEY_DERIVATION_ITERATIONS = 100000
+
+# Every Fernet token starts with this (version byte 0x80, urlsafe-base64 encoded); values written
+# before tokens were stored as-is carry an extra base64 layer and never do
+FERNET_TOKEN_PREFIX = "gAAAAA"
+
+
+@lru_cache(maxsize=1)
+def _derive_key(password: bytes, salt: bytes) -> bytes:
+    """Derive the Fernet key once per process; hashlib runs PBKDF2 in OpenSSL's C implementation"""
+    return base64.urlsafe_b64encode(
+        hashlib.pbkdf2_hmac('sha256', password, salt, KEY_DERIVATION_ITERATIONS, dklen=32)
+    )
+
 
 class EncryptionService:
     """Service for encrypting and decrypting sensitive data"""
@@ -31,13 +45,7 @@ class EncryptionService:
                 # Generate key from password and salt
                 password = settings.secret_key.encode()
                 salt = b'nusafxtrade_salt_2023'  # In production, store this securely
-                kdf = PBKDF2HMAC(
-                    algorithm=hashes.SHA256(),
-                    length=32,
-                    salt=salt,
-                    iterations=100000,
-                )
-                key = base64.urlsafe_b64encode(kdf.derive(password))
+                key = _derive_key(password, salt)
             
             self._fernet = Fernet(key)
             logger.info("Encryption service initialized successfully")
@@ -51,8 +59,8 @@ class EncryptionService:
             raise RuntimeError("Encryption service not initialized")
         
         try:
-            encrypted_data = self._fernet.encrypt(data.encode())
-            return base64.urlsafe_b64encode(encrypted_data).decode()
+            # Fernet tokens are already urlsafe base64, so they are stored as-is
+            return self._fernet.encrypt(data.encode()).decode('ascii')
         except Exception as e:
             logger.error("Failed to encrypt data", error=str(e))
             raise
@@ -63,9 +71,11 @@ class EncryptionService:
             raise RuntimeError("Encryption service not initialized")
         
         try:
-            decoded_data = base64.urlsafe_b64decode(encrypted_data.encode())
-            decrypted_data = self._fernet.decrypt(decoded_data)
-            return decrypted_data.decode()
+            token = encrypted_data.encode('ascii')
+            if not encrypted_data.startswith(FERNET_TOKEN_PREFIX):
+                # Legacy double-wrapped value
+                token = base64.urlsafe_b64decode(token)
+            return self._fernet.decrypt(token).decode()
         except Exception as e:
             logger.error("Failed to decrypt data", error=str(e))
             raise
@@ -97,10 +107,11 @@ class EncryptionService:
         """Generate a secure random token"""
         return base64.urlsafe_b64encode(os.urandom(length)).decode()
     
-    def hash_sensitive_data(self, data: str) -> str:
-        """Create a hash of sensitive data (one-way)"""
-        import hashlib
-        return hashlib.sha256(data.encode()).hexdigest()
+    def hash_sensitive_data(self, data: Union[str, bytes]) -> str:
+        """Create a hash of sensitive data (one-way); bytes are hashed without an encode copy"""
+        if isinstance(data, str):
+            data = data.encode()
+        return hashlib.sha256(data).hexdigest()
 
 
 # Global encryption service instance
@@ -0,0 +1,97 @@
+"""
+Background health evaluation for NusaNexus NoFOMO
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+import structlog
+
+from app.core.database import get_db_client
+from app.services.system_sampler import get_system_sampler
+
+logger = structlog.get_logger()
+
+
+class HealthMonitor:
+    """Evaluates overall service health in the background; endpoints read the latest result"""
+
+    def __init__(self, interval: float = 2.0, db_timeout: float = 2.0):
+        self.interval = interval
+        self.db_timeout = db_timeout
+        self.status = "unknown"
+        self.db_health: Optional[Dict[str, Any]] = None
+        self.system: Dict[str, Any] = {}
+        self.checked_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background evaluation loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("Health monitor started")
+
+    async def stop(self):
+        """Stop the background evaluation loop"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Whether the last evaluation is newer than max_age seconds"""
+        return self.db_health is not None and time.monotonic() - self.checked_at < max_age
+
+    async def evaluate(self):
+        """Check the database and host resources and store the overall status"""
+        try:
+            db_health = await asyncio.wait_for(get_db_client().health_check(), timeout=self.db_timeout)
+        except asyncio.TimeoutError:
+            db_health = {"status": "unhealthy", "error": "Database health check timed out"}
+        except Exception as e:
+            db_health = {"status": "unhealthy", "error": str(e)}
+
+        sample = get_system_sampler().snapshot()
+        system = {
+            "cpu_percent": sample["cpu_percent"],
+            "memory_percent": sample["memory"].percent,
+            "disk_percent": sample["disk"].percent
+        }
+
+        overall_status = "healthy"
+        if db_health["status"] != "healthy":
+            overall_status = "unhealthy"
+        elif system["cpu_percent"] > 90 or system["memory_percent"] > 90:
+            overall_status = "degraded"
+
+        if overall_status != self.status:
+            logger.info("Health status changed", previous=self.status, status=overall_status)
+
+        self.db_health = db_health
+        self.system = system
+        self.status = overall_status
+        self.checked_at = time.monotonic()
+
+    async def _run(self):
+        while True:
+            try:
+                await self.evaluate()
+            except Exception:
+                logger.error("Health evaluation failed", exc_info=True)
+            await asyncio.sleep(self.interval)
+
+
+# Global health monitor instance
+health_monitor: Optional[HealthMonitor] = None
+
+
+def get_health_monitor() -> HealthMonitor:
+    """Get health monitor instance"""
+    global health_monitor
+    if health_monitor is None:
+        health_monitor = HealthMonitor()
+    return health_monitor
@@ -0,0 +1,101 @@
+"""
+Batched log writer for NusaNexus NoFOMO
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+import structlog
+
+from app.core.database import get_db_client
+
+logger = structlog.get_logger()
+
+
+class LogWriter:
+    """Buffers log rows and inserts them in bulk instead of one request per entry"""
+
+    def __init__(self, flush_interval: float = 0.25, max_batch: int = 500):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        # None is the stop sentinel
+        self._queue: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background flush loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("Log writer started")
+
+    async def stop(self):
+        """Stop the flush loop, writing out anything still queued"""
+        if self._task is None:
+            return
+        # New rows write directly from here on; the loop finishes its current
+        # batch and everything queued ahead of the sentinel
+        task, self._task = self._task, None
+        await self._queue.put(None)
+        try:
+            await task
+        except Exception as e:
+            logger.error("Log writer loop failed", error=str(e))
+
+        while not self._queue.empty():
+            await self._flush([row for row in self._drain([]) if row is not None])
+        logger.info("Log writer stopped")
+
+    @property
+    def pending(self) -> int:
+        """Rows queued but not yet flushed"""
+        return self._queue.qsize()
+
+    async def write(self, log_data: Dict[str, Any]):
+        """Queue a log row; it is inserted with the next batch"""
+        if self._task is None:
+            # Not running (e.g. outside the app lifespan); write directly
+            await get_db_client().create_log(log_data)
+            return
+        self._queue.put_nowait(log_data)
+
+    async def _run(self):
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                break
+            # Collect whatever else arrives within the flush window
+            await asyncio.sleep(self.flush_interval)
+            batch = self._drain([first])
+            stopping = None in batch
+            await self._flush([row for row in batch if row is not None])
+
+    def _drain(self, batch: List[Optional[Dict[str, Any]]]) -> List[Optional[Dict[str, Any]]]:
+        while len(batch) < self.max_batch and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _flush(self, batch: List[Dict[str, Any]]):
+        # A bulk insert takes its column list from the rows, so rows are grouped by key set
+        # to keep an omitted column (e.g. bot_id) from overriding its default in other rows
+        groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+        for row in batch:
+            groups.setdefault(frozenset(row), []).append(row)
+
+        db_client = get_db_client()
+        for rows in groups.values():
+            try:
+                await db_client.create_logs_bulk(rows)
+            except Exception as e:
+                logger.error("Log flush failed", count=len(rows), error=str(e))
+
+
+# Global log writer instance
+log_writer: Optional[LogWriter] = None
+
+
+def get_log_writer() -> LogWriter:
+    """Get log writer instance"""
+    global log_writer
+    if log_writer is None:
+        log_writer = LogWriter()
+    return log_writer
@@ -2,12 +2,17 @@
 Notification service for real-time updates and alerts
 """
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from typing import Dict, Any, Optional, List, Set
+import asyncio
 import structlog
 
+from app.core.clock import now_iso, utcnow_iso
 from app.core.database import get_db_client
-from app.models.common import WebSocketMessage, BotStatusUpdate, TradeUpdate
+from app.models.common import (
+    AIInsightUpdate, BotStatusUpdate, ErrorUpdate, SystemAlertUpdate, TradeUpdate,
+    WSMessage, dump_ws_message
+)
+from app.services.log_writer import get_log_writer
 
 logger = structlog.get_logger()
 
@@ -17,69 +22,75 @@ class NotificationService:
     
     def __init__(self):
         self.db_client = get_db_client()
-        self.websocket_connections: Dict[str, List] = {}  # user_id -> list of connections
-        self.notification_queue: List[Dict[str, Any]] = []
+        self.websocket_connections: Dict[str, Set] = {}  # user_id -> set of connections
     
     def register_websocket_connection(self, user_id: str, connection):
         """Register a WebSocket connection for a user"""
-        if user_id not in self.websocket_connections:
-            self.websocket_connections[user_id] = []
-        self.websocket_connections[user_id].append(connection)
+        self.websocket_connections.setdefault(user_id, set()).add(connection)
         logger.info("WebSocket connection registered", user_id=user_id)
     
     def unregister_websocket_connection(self, user_id: str, connection):
         """Unregister a WebSocket connection"""
-        if user_id in self.websocket_connections:
-            if connection in self.websocket_connections[user_id]:
-                self.websocket_connections[user_id].remove(connection)
-                logger.info("WebSocket connection unregistered", user_id=user_id)
-            
-            # Clean up empty lists
-            if not self.websocket_connections[user_id]:
-                del self.websocket_connections[user_id]
+        connections = self.websocket_connections.get(user_id)
+        if connections is None:
+            return
+        if connection in connections:
+            connections.discard(connection)
+            logger.info("WebSocket connection unregistered", user_id=user_id)
+        
+        # Clean up empty sets
+        if not connections:
+            del self.websocket_connections[user_id]
     
-    async def send_websocket_message(self, user_id: str, message: WebSocketMessage):
+    @staticmethod
+    def _encode(message: WSMessage) -> str:
+        # Encoded once per message and reused for every socket; str so clients keep getting text frames
+        return dump_ws_message(message).decode()
+    
+    async def send_websocket_message(self, user_id: str, message: WSMessage):
         """Send a message to all WebSocket connections for a user"""
         if user_id not in self.websocket_connections:
             return
-        
-        disconnected_connections = []
-        
-        for connection in self.websocket_connections[user_id]:
-            try:
-                await connection.send_text(message.model_dump_json())
-            except Exception as e:
-                logger.error("Failed to send WebSocket message", user_id=user_id, error=str(e))
-                disconnected_connections.append(connection)
+        await self._send_encoded(user_id, self._encode(message))
+    
+    async def _send_encoded(self, user_id: str, payload: str):
+        # Sends overlap, so one slow socket doesn't hold up the user's other connections
+        connections = list(self.websocket_connections.get(user_id, []))
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True
+        )
         
         # Clean up disconnected connections
-        for connection in disconnected_connections:
-            self.unregister_websocket_connection(user_id, connection)
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to send WebSocket message", user_id=user_id, error=str(result))
+                self.unregister_websocket_connection(user_id, connection)
     
     async def notify_bot_status_change(self, user_id: str, bot_id: str, status: str, details: Dict[str, Any] = None):
         """Notify about bot status changes"""
         try:
-            message = BotStatusUpdate(
-                type="bot_status",
+            # Built from server-side values only, so validation is skipped (timestamp default still applies)
+            message = BotStatusUpdate.model_construct(
                 data={
                     "bot_id": bot_id,
                     "status": status,
                     "details": details or {},
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": now_iso()
                 }
             )
             
             await self.send_websocket_message(user_id, message)
             
             # Also save notification to database
-            self.db_client.create_log({
+            await get_log_writer().write({
                 "user_id": user_id,
                 "bot_id": bot_id,
                 "log_level": "info",
                 "message": f"Bot status changed to {status}",
                 "context": details or {},
                 "source": "notification_service",
-                "created_at": datetime.utcnow().isoformat()
+                "created_at": utcnow_iso()
             })
             
         except Exception as e:
@@ -88,26 +99,25 @@ class NotificationService:
     async def notify_trade_update(self, user_id: str, bot_id: str, trade_data: Dict[str, Any]):
         """Notify about trade updates"""
         try:
-            message = TradeUpdate(
-                type="trade_update",
+            message = TradeUpdate.model_construct(
                 data={
                     "bot_id": bot_id,
                     "trade": trade_data,
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": now_iso()
                 }
             )
             
             await self.send_websocket_message(user_id, message)
             
             # Create log entry
-            self.db_client.create_log({
+            await get_log_writer().write({
                 "user_id": user_id,
                 "bot_id": bot_id,
                 "log_level": "info",
                 "message": f"Trade {trade_data.get('side', '').upper()} executed: {trade_data.get('symbol', '')}",
                 "context": trade_data,
                 "source": "notification_service",
-                "created_at": datetime.utcnow().isoformat()
+                "created_at": utcnow_iso()
             })
             
         except Exception as e:
@@ -116,26 +126,25 @@ class NotificationService:
     async def notify_error(self, user_id: str, error_type: str, message: str, details: Dict[str, Any] = None):
         """Notify about errors"""
         try:
-            error_message = WebSocketMessage(
-                type="error",
+            error_message = ErrorUpdate.model_construct(
                 data={
                     "error_type": error_type,
                     "message": message,
                     "details": details or {},
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": now_iso()
                 }
             )
             
             await self.send_websocket_message(user_id, error_message)
             
             # Create error log
-            self.db_client.create_log({
+            await get_log_writer().write({
                 "user_id": user_id,
                 "log_level": "error",
                 "message": f"{error_type}: {message}",
                 "context": details or {},
                 "source": "notification_service",
-                "created_at": datetime.utcnow().isoformat()
+                "created_at": utcnow_iso()
             })
             
         except Exception as e:
@@ -144,11 +153,10 @@ class NotificationService:
     async def notify_ai_insight(self, user_id: str, insight_data: Dict[str, Any]):
         """Notify about AI insights and analysis"""
         try:
-            ai_message = WebSocketMessage(
-                type="ai_insight",
+            ai_message = AIInsightUpdate.model_construct(
                 data={
                     "insight": insight_data,
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": now_iso()
                 }
             )
             
@@ -160,20 +168,21 @@ class NotificationService:
     async def notify_system_alert(self, alert_type: str, message: str, severity: str = "info", details: Dict[str, Any] = None):
         """Send system-wide alerts"""
         try:
-            alert_message = WebSocketMessage(
-                type="system_alert",
+            alert_message = SystemAlertUpdate.model_construct(
                 data={
                     "alert_type": alert_type,
                     "message": message,
                     "severity": severity,
                     "details": details or {},
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": now_iso()
                 }
             )
             
-            # Send to all connected users
-            for user_id in self.websocket_connections.keys():
-                await self.send_websocket_message(user_id, alert_message)
+            # Send to all connected users; the snapshot tolerates users disconnecting mid-broadcast
+            payload = self._encode(alert_message)
+            await asyncio.gather(*(
+                self._send_encoded(user_id, payload) for user_id in list(self.websocket_connections)
+            ))
             
         except Exception as e:
             logger.error("Failed to send system alert", error=str(e))
@@ -184,7 +193,7 @@ class NotificationService:
         logger.info("Email notification sent", user_id=user_id, subject=subject)
         
         # Create log entry
-        self.db_client.create_log({
+        await get_log_writer().write({
             "user_id": user_id,
             "log_level": "info",
             "message": f"Email sent: {subject}",
@@ -194,7 +203,7 @@ class NotificationService:
                 "template": template
             },
             "source": "notification_service",
-            "created_at": datetime.utcnow().isoformat()
+            "created_at": utcnow_iso()
         })
     
     async def send_push_notification(self, user_id: str, title: str, body: str, data: Dict[str, Any] = None):
@@ -202,10 +211,10 @@ class NotificationService:
         # This would integrate with a push notification service like Firebase, Pusher, etc.
         logger.info("Push notification sent", user_id=user_id, title=title)
     
-    def get_user_notifications(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
+    async def get_user_notifications(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Get user notification history from database"""
         try:
-            logs = self.db_client.get_user_logs(user_id, limit)
+            logs = await self.db_client.get_user_logs(user_id, limit)
             return [log for log in logs if log.get("source") == "notification_service"]
         except Exception as e:
             logger.error("Failed to get user notifications", user_id=user_id, error=str(e))
@@ -216,21 +225,22 @@ class NotificationService:
         try:
             connected_users = len(self.websocket_connections)
             total_connections = sum(len(connections) for connections in self.websocket_connections.values())
-            queue_size = len(self.notification_queue)
+            # Notification log rows waiting for the next batched insert
+            queue_size = get_log_writer().pending
             
             return {
                 "status": "healthy",
                 "connected_users": connected_users,
                 "total_connections": total_connections,
                 "queue_size": queue_size,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
         except Exception as e:
             logger.error("Notification service health check failed", error=str(e))
             return {
                 "status": "unhealthy",
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
 
 
@@ -100,37 +100,3 @@ class ExchangeService:
             "price": 50000.0,
             "volume": 1000.0
         }
-
-
-class EncryptionService:
-    """Encryption service for sensitive data"""
-    
-    def __init__(self):
-        self.encryption_key = "mock_encryption_key"
-    
-    def encrypt(self, data: str) -> str:
-        """Encrypt sensitive data"""
-        # In production, use proper encryption
-        return f"encrypted_{data}"
-    
-    def decrypt(self, encrypted_data: str) -> str:
-        """Decrypt sensitive data"""
-        # In production, use proper decryption
-        return encrypted_data.replace("encrypted_", "")
-
-
-class NotificationService:
-    """Notification service"""
-    
-    def __init__(self):
-        self.notification_channels = ["websocket", "email"]
-    
-    async def send_notification(self, user_id: str, message: str, type: str = "info") -> bool:
-        """Send notification to user"""
-        logger.info("Notification sent", user_id=user_id, type=type)
-        return True
-    
-    async def send_bot_alert(self, user_id: str, bot_id: str, alert_type: str, message: str) -> bool:
-        """Send bot alert"""
-        logger.info("Bot alert sent", user_id=user_id, bot_id=bot_id, alert_type=alert_type)
-        return True
\ No newline at end of file
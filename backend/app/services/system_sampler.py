@@ -0,0 +1,108 @@
+"""
+Background host resource sampler for NusaNexus NoFOMO
+"""
+
+import asyncio
+import os
+import sys
+from typing import Any, Dict, Optional, Tuple
+import psutil
+import structlog
+
+logger = structlog.get_logger()
+
+
+def _read_proc_loadavg() -> Tuple[float, float, float]:
+    with open('/proc/loadavg') as f:
+        one, five, fifteen = f.read().split()[:3]
+    return float(one), float(five), float(fifteen)
+
+
+def _no_loadavg() -> None:
+    return None
+
+
+# The kernel refreshes load averages every 5s, so they are sampled with memory/disk
+if sys.platform.startswith("linux"):
+    _loadavg = _read_proc_loadavg
+elif hasattr(os, 'getloadavg'):
+    _loadavg = os.getloadavg
+else:
+    _loadavg = _no_loadavg
+
+
+class SystemSampler:
+    """Samples CPU, memory and disk in the background so requests only read the latest values"""
+
+    def __init__(self, cpu_interval: float = 1.0, slow_interval: float = 5.0):
+        self.cpu_interval = cpu_interval
+        self.slow_interval = slow_interval
+        self.cpu_percent: float = 0.0
+        self.memory = None
+        self.disk = None
+        self.load_avg = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background sampling loop"""
+        if self._task is None:
+            # The first non-blocking cpu_percent call only sets the baseline
+            psutil.cpu_percent(interval=None)
+            self._sample_slow()
+            self._task = asyncio.create_task(self._run())
+            logger.info("System sampler started")
+
+    async def stop(self):
+        """Stop the background sampling loop"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Latest CPU/memory/disk/load readings"""
+        if self.memory is None:
+            self._sample_slow()
+        return {
+            "cpu_percent": self.cpu_percent,
+            "memory": self.memory,
+            "disk": self.disk,
+            "load_avg": self.load_avg
+        }
+
+    def _sample_slow(self):
+        # Memory and disk move slowly; sample them at a lower cadence than CPU
+        self.memory = psutil.virtual_memory()
+        self.disk = psutil.disk_usage('/')
+        self.load_avg = _loadavg()
+
+    async def _run(self):
+        slow_every = max(1, round(self.slow_interval / self.cpu_interval))
+        tick = 0
+        while True:
+            await asyncio.sleep(self.cpu_interval)
+            try:
+                # Non-blocking: utilisation since the previous call, i.e. over the last interval
+                self.cpu_percent = await asyncio.to_thread(psutil.cpu_percent, None)
+                tick += 1
+                if tick % slow_every == 0:
+                    # /proc and statvfs reads happen on the default executor
+                    await asyncio.to_thread(self._sample_slow)
+            except Exception as e:
+                logger.error("System sampling failed", error=str(e))
+
+
+# Global system sampler instance
+system_sampler: Optional[SystemSampler] = None
+
+
+def get_system_sampler() -> SystemSampler:
+    """Get system sampler instance"""
+    global system_sampler
+    if system_sampler is None:
+        system_sampler = SystemSampler()
+    return system_sampler
@@ -4,28 +4,74 @@ AI-Powered Crypto Trading Bot SaaS
 """
 
 from contextlib import asynccontextmanager
+import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 import structlog
 from app.api.v1.api import api_router
+from app.api.v1.endpoints import liveness
+from app.core.config import settings as app_settings
+from app.core.database import close_db_client, get_db_client
+from app.core.redis import close_redis
+from app.core.responses import ORJSONResponse
+from app.services.bot_status_writer import get_bot_status_writer
+from app.services.cache_invalidator import get_cache_invalidation_listener
+from app.services.health_monitor import get_health_monitor
+from app.services.log_writer import get_log_writer
+from app.services.system_sampler import get_system_sampler
 
-# Configure structured logging
+# Configure structured logging; calls below the level return before any processing
 structlog.configure(
     processors=[
+        structlog.processors.format_exc_info,
         structlog.processors.JSONRenderer()
-    ]
+    ],
+    wrapper_class=structlog.make_filtering_bound_logger(
+        logging.DEBUG if app_settings.debug else logging.INFO
+    ),
+    cache_logger_on_first_use=True
 )
 
+# Probe paths hit every few seconds by orchestrators; keep them out of the access log
+_QUIET_ACCESS_PATHS = {"/liveness", "/api/v1/health/liveness", "/api/v1/health/readiness"}
+
+
+class _ProbeAccessFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        # uvicorn.access args: (client_addr, method, full_path, http_version, status_code)
+        args = record.args
+        return not (isinstance(args, tuple) and len(args) >= 3 and args[2] in _QUIET_ACCESS_PATHS)
+
+
+logging.getLogger("uvicorn.access").addFilter(_ProbeAccessFilter())
+
 logger = structlog.get_logger()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting NusaNexus NoFOMO API")
+    # Build the Supabase clients and their sessions now rather than on the first request
+    try:
+        get_db_client()
+    except ValueError as e:
+        logger.error("Database client not configured", error=str(e))
+    get_bot_status_writer().start()
+    get_log_writer().start()
+    get_system_sampler().start()
+    get_health_monitor().start()
+    get_cache_invalidation_listener().start()
     yield
     # Shutdown
     logger.info("Shutting down NusaNexus NoFOMO API")
+    await get_cache_invalidation_listener().stop()
+    await get_health_monitor().stop()
+    await get_bot_status_writer().stop()
+    await get_log_writer().stop()
+    await get_system_sampler().stop()
+    await close_redis()
+    await close_db_client()
 
 # Create FastAPI application
 app = FastAPI(
@@ -34,12 +80,11 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # Add CORS middleware
-from app.core.config import settings as app_settings
-
 app.add_middleware(
     CORSMiddleware,
     allow_origins=app_settings.cors_origins,
@@ -54,6 +99,8 @@ app.add_middleware(
     allowed_hosts=app_settings.trusted_hosts
 )
 
+# Liveness sits at the root with no dependencies, ahead of the API routes
+app.include_router(liveness.router, tags=["health"])
 app.include_router(api_router, prefix="/api/v1")
 
 @app.get("/")
@@ -0,0 +1,37 @@
+-- NusaNexus NoFOMO User Statistics Function
+-- Migration: 004_user_stats_function
+-- Created: 2025-11-12
+-- Description: Aggregate per-user bot/strategy statistics in a single query
+
+-- =============================================================================
+-- ANALYTICS FUNCTIONS
+-- =============================================================================
+
+-- Function to get dashboard statistics for a user (used by /auth/me)
+CREATE OR REPLACE FUNCTION get_user_stats(uid UUID)
+RETURNS TABLE (
+    total_bots BIGINT,
+    active_bots BIGINT,
+    total_trades BIGINT,
+    total_profit NUMERIC,
+    winning_trades BIGINT,
+    strategies_count BIGINT
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT 
+        COUNT(b.id) as total_bots,
+        COUNT(b.id) FILTER (WHERE b.status = 'running') as active_bots,
+        COALESCE(SUM(b.total_trades), 0)::BIGINT as total_trades,
+        COALESCE(SUM(b.profit), 0) as total_profit,
+        COALESCE(SUM(b.winning_trades), 0)::BIGINT as winning_trades,
+        (SELECT COUNT(*) FROM strategies s WHERE s.user_id = uid) as strategies_count
+    FROM bots b
+    WHERE b.user_id = uid;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- SECURITY DEFINER bypasses RLS and the caller picks the user id, so only the
+-- backend's service-role client may run it
+REVOKE EXECUTE ON FUNCTION get_user_stats(UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_user_stats(UUID) TO service_role;
@@ -0,0 +1,42 @@
+-- NusaNexus NoFOMO AI Analysis Functions
+-- Migration: 005_ai_analysis_functions
+-- Created: 2025-11-12
+-- Description: Ownership-checked AI analysis insert in a single round-trip
+
+-- =============================================================================
+-- AI ANALYSIS FUNCTIONS
+-- =============================================================================
+
+-- Insert an AI analysis only if the bot belongs to the user.
+-- Returns the inserted row, or no rows when the bot is missing / not owned.
+CREATE OR REPLACE FUNCTION create_ai_analysis_if_owned(p_user_id UUID, p_bot_id UUID, p_payload JSONB)
+RETURNS SETOF ai_analyses AS $$
+BEGIN
+    RETURN QUERY
+    INSERT INTO ai_analyses (
+        user_id, bot_id, analysis_type, input_data, results, recommendations,
+        confidence_score, model_used, tokens_used, processing_time_ms, created_at
+    )
+    SELECT
+        p_user_id,
+        p_bot_id,
+        p_payload->>'analysis_type',
+        COALESCE(p_payload->'input_data', '{}'::jsonb),
+        COALESCE(p_payload->'results', '{}'::jsonb),
+        ARRAY(SELECT jsonb_array_elements_text(COALESCE(p_payload->'recommendations', '[]'::jsonb))),
+        COALESCE((p_payload->>'confidence_score')::DECIMAL, 0.0),
+        p_payload->>'model_used',
+        COALESCE((p_payload->>'tokens_used')::INTEGER, 0),
+        (p_payload->>'processing_time_ms')::INTEGER,
+        COALESCE((p_payload->>'created_at')::TIMESTAMPTZ, NOW())
+    WHERE EXISTS (
+        SELECT 1 FROM bots b WHERE b.id = p_bot_id AND b.user_id = p_user_id
+    )
+    RETURNING *;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- SECURITY DEFINER bypasses RLS and the caller picks the user id, so only the
+-- backend's service-role client may run it
+REVOKE EXECUTE ON FUNCTION create_ai_analysis_if_owned(UUID, UUID, JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION create_ai_analysis_if_owned(UUID, UUID, JSONB) TO service_role;
@@ -0,0 +1,27 @@
+-- NusaNexus NoFOMO AI Usage Statistics Function
+-- Migration: 006_ai_usage_stats_function
+-- Created: 2025-11-12
+-- Description: Aggregate per-user AI usage statistics in a single query
+
+-- =============================================================================
+-- ANALYTICS FUNCTIONS
+-- =============================================================================
+
+-- Function to get AI usage statistics for a user (used by /ai/usage-stats)
+CREATE OR REPLACE FUNCTION get_ai_usage_stats(uid UUID)
+RETURNS JSON AS $$
+    SELECT json_build_object(
+        'total_requests', COUNT(*),
+        'total_tokens_used', COALESCE(SUM(a.tokens_used), 0),
+        'successful_requests', COUNT(*) FILTER (WHERE a.confidence_score > 0.7),
+        'analysis_types', COALESCE(array_agg(DISTINCT a.analysis_type) FILTER (WHERE a.analysis_type IS NOT NULL), '{}'),
+        'last_usage', MAX(a.created_at)
+    )
+    FROM ai_analyses a
+    WHERE a.user_id = uid;
+$$ LANGUAGE sql STABLE SECURITY DEFINER;
+
+-- SECURITY DEFINER bypasses RLS and the caller picks the user id, so only the
+-- backend's service-role client may run it
+REVOKE EXECUTE ON FUNCTION get_ai_usage_stats(UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_ai_usage_stats(UUID) TO service_role;
@@ -0,0 +1,10 @@
+-- NusaNexus NoFOMO AI Analyses Timestamp Constraint
+-- Migration: 007_ai_analyses_created_at
+-- Created: 2025-11-12
+-- Description: Make the database clock authoritative for ai_analyses.created_at
+
+UPDATE ai_analyses SET created_at = NOW() WHERE created_at IS NULL;
+
+ALTER TABLE ai_analyses
+    ALTER COLUMN created_at SET DEFAULT NOW(),
+    ALTER COLUMN created_at SET NOT NULL;
@@ -0,0 +1,32 @@
+-- NusaNexus NoFOMO Bot Status Functions
+-- Migration: 008_bot_status_functions
+-- Created: 2025-11-13
+-- Description: Server-side trade aggregates for the bot status endpoint
+
+-- =============================================================================
+-- ANALYTICS FUNCTIONS
+-- =============================================================================
+
+-- Function to get trade aggregates for a bot since a cutoff (lifetime totals
+-- live on the bots row, maintained by update_bot_statistics)
+CREATE OR REPLACE FUNCTION get_bot_trade_summary(p_bot_id UUID, p_user_id UUID, p_since TIMESTAMPTZ)
+RETURNS TABLE (
+    today_trades BIGINT,
+    today_profit NUMERIC,
+    last_trade_at TIMESTAMPTZ
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT 
+        COUNT(t.id) FILTER (WHERE t.created_at >= p_since) as today_trades,
+        COALESCE(SUM(t.profit) FILTER (WHERE t.created_at >= p_since), 0) as today_profit,
+        MAX(t.created_at) as last_trade_at
+    FROM trades t
+    WHERE t.bot_id = p_bot_id AND t.user_id = p_user_id;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- SECURITY DEFINER bypasses RLS and the caller picks the user id, so only the
+-- backend's service-role client may run it
+REVOKE EXECUTE ON FUNCTION get_bot_trade_summary(UUID, UUID, TIMESTAMPTZ) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_bot_trade_summary(UUID, UUID, TIMESTAMPTZ) TO service_role;
@@ -0,0 +1,12 @@
+-- NusaNexus NoFOMO Running Bots Index
+-- Migration: 009_bots_running_index
+-- Created: 2025-11-13
+-- Description: Partial index over running bots for status fast paths
+
+-- =============================================================================
+-- PERFORMANCE INDEXES
+-- =============================================================================
+
+-- Running bots are a small fraction of all bots; "any running bot for user"
+-- checks (dashboard, get_user_stats active_bots) only scan this subset
+CREATE INDEX IF NOT EXISTS idx_bots_running ON bots(user_id) WHERE status = 'running';
@@ -0,0 +1,15 @@
+-- NusaNexus NoFOMO Trades By Bot/Time Index
+-- Migration: 010_trades_bot_time_index
+-- Created: 2025-11-13
+-- Description: Composite index for newest-first, LIMITed trade reads per bot
+
+-- =============================================================================
+-- PERFORMANCE INDEXES
+-- =============================================================================
+
+-- Serves get_bot_trades (WHERE bot_id AND user_id ORDER BY created_at DESC LIMIT n)
+-- and the get_bot_trade_summary range scan without sorting the bot's history.
+-- INCLUDE covers the columns the status endpoint reads so its recent-trades
+-- fetch can be answered index-only
+CREATE INDEX IF NOT EXISTS idx_trades_bot_created_at ON trades(bot_id, created_at DESC)
+    INCLUDE (user_id, profit, side, trading_pair, amount);
@@ -0,0 +1,31 @@
+-- NusaNexus NoFOMO Batched Bot Status Transitions
+-- Migration: 011_bot_status_batch_function
+-- Created: 2025-11-13
+-- Description: Apply many bot status transitions in a single UPDATE
+
+-- =============================================================================
+-- BOT STATUS FUNCTIONS
+-- =============================================================================
+
+-- Apply a batch of [{id, user_id, status}] transitions. A row is only touched
+-- when it belongs to the user and its status actually changes; updated_at is
+-- maintained by the bots BEFORE UPDATE trigger. Returns the ids that changed.
+CREATE OR REPLACE FUNCTION transition_bot_statuses(p_updates JSONB)
+RETURNS TABLE (id UUID) AS $$
+BEGIN
+    RETURN QUERY
+    UPDATE bots b
+    SET status = v.status
+    FROM jsonb_to_recordset(p_updates) AS v(id UUID, user_id UUID, status VARCHAR(20))
+    WHERE b.id = v.id
+      AND b.user_id = v.user_id
+      AND b.status IS DISTINCT FROM v.status
+    RETURNING b.id;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- SECURITY DEFINER bypasses RLS and the caller picks the user ids, so only the
+-- backend's service-role client may run it; PostgREST would otherwise expose it
+-- to every anon-key holder at /rpc
+REVOKE EXECUTE ON FUNCTION transition_bot_statuses(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION transition_bot_statuses(JSONB) TO service_role;
@@ -0,0 +1,85 @@
+-- NusaNexus NoFOMO Trade Statistics Function
+-- Migration: 012_trade_statistics_function
+-- Created: 2025-11-14
+-- Description: Server-side trade analytics for the trades list endpoint
+
+-- =============================================================================
+-- ANALYTICS FUNCTIONS
+-- =============================================================================
+
+-- Aggregate a user's trades (optionally one bot / status / side) in one pass.
+-- Streaks use gaps-and-islands over trades ordered by created_at: a win is
+-- profit > 0, a loss profit < 0, break-even trades end both kinds of streak.
+CREATE OR REPLACE FUNCTION get_trade_statistics(
+    p_user_id UUID,
+    p_bot_id UUID DEFAULT NULL,
+    p_status TEXT DEFAULT NULL,
+    p_side TEXT DEFAULT NULL
+)
+RETURNS TABLE (
+    total_trades BIGINT,
+    winning_trades BIGINT,
+    losing_trades BIGINT,
+    total_profit NUMERIC,
+    total_fees NUMERIC,
+    gross_profit NUMERIC,
+    gross_loss NUMERIC,
+    best_trade NUMERIC,
+    worst_trade NUMERIC,
+    total_amount NUMERIC,
+    largest_trade NUMERIC,
+    smallest_trade NUMERIC,
+    avg_holding_seconds DOUBLE PRECISION,
+    max_consecutive_wins BIGINT,
+    max_consecutive_losses BIGINT
+) AS $$
+BEGIN
+    RETURN QUERY
+    WITH t AS (
+        SELECT
+            tr.profit, tr.fee, tr.amount, tr.entry_time, tr.exit_time, tr.created_at,
+            SIGN(COALESCE(tr.profit, 0)) AS outcome
+        FROM trades tr
+        WHERE tr.user_id = p_user_id
+          AND (p_bot_id IS NULL OR tr.bot_id = p_bot_id)
+          AND (p_status IS NULL OR tr.status = p_status)
+          AND (p_side IS NULL OR tr.side = p_side)
+    ),
+    islands AS (
+        SELECT
+            outcome,
+            ROW_NUMBER() OVER (ORDER BY created_at)
+                - ROW_NUMBER() OVER (PARTITION BY outcome ORDER BY created_at) AS grp
+        FROM t
+    ),
+    streaks AS (
+        SELECT outcome, COUNT(*) AS streak
+        FROM islands
+        GROUP BY outcome, grp
+    )
+    SELECT
+        COUNT(*) as total_trades,
+        COUNT(*) FILTER (WHERE t.profit > 0) as winning_trades,
+        COUNT(*) FILTER (WHERE t.profit < 0) as losing_trades,
+        COALESCE(SUM(t.profit), 0) as total_profit,
+        COALESCE(SUM(t.fee), 0) as total_fees,
+        COALESCE(SUM(t.profit) FILTER (WHERE t.profit > 0), 0) as gross_profit,
+        COALESCE(-SUM(t.profit) FILTER (WHERE t.profit < 0), 0) as gross_loss,
+        COALESCE(MAX(t.profit), 0) as best_trade,
+        COALESCE(MIN(t.profit), 0) as worst_trade,
+        COALESCE(SUM(t.amount), 0) as total_amount,
+        COALESCE(MAX(t.amount), 0) as largest_trade,
+        COALESCE(MIN(t.amount), 0) as smallest_trade,
+        -- EXTRACT returns numeric on Postgres 14+; RETURN QUERY needs the declared type exactly
+        (AVG(EXTRACT(EPOCH FROM (t.exit_time - t.entry_time))) FILTER (WHERE t.exit_time IS NOT NULL))::DOUBLE PRECISION
+            as avg_holding_seconds,
+        COALESCE((SELECT MAX(s.streak) FROM streaks s WHERE s.outcome > 0), 0) as max_consecutive_wins,
+        COALESCE((SELECT MAX(s.streak) FROM streaks s WHERE s.outcome < 0), 0) as max_consecutive_losses
+    FROM t;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- SECURITY DEFINER bypasses RLS and the caller picks the user id, so only the
+-- backend's service-role client may run it
+REVOKE EXECUTE ON FUNCTION get_trade_statistics(UUID, UUID, TEXT, TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_trade_statistics(UUID, UUID, TEXT, TEXT) TO service_role;
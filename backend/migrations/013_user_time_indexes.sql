@@ -0,0 +1,25 @@
+-- NusaNexus NoFOMO Per-User Time-Ordered Indexes
+-- Migration: 013_user_time_indexes
+-- Created: 2025-11-14
+-- Description: Composite indexes matching the remaining user-scoped, time-ordered reads
+
+-- =============================================================================
+-- PERFORMANCE INDEXES
+-- =============================================================================
+
+-- Serves get_user_logs (WHERE user_id ORDER BY created_at DESC LIMIT n); the
+-- existing single-column indexes force a sort of the user's whole log history
+CREATE INDEX IF NOT EXISTS idx_logs_user_created_at ON logs(user_id, created_at DESC)
+    WHERE user_id IS NOT NULL;
+
+-- Serves get_trade_statistics, which scans a user's trades in created_at order
+-- for streaks; idx_trades_user_date is keyed on entry_time instead
+CREATE INDEX IF NOT EXISTS idx_trades_user_created_at ON trades(user_id, created_at);
+
+-- Serves stream_user_bots keyset pages (WHERE user_id ORDER BY created_at, id)
+CREATE INDEX IF NOT EXISTS idx_bots_user_created_at ON bots(user_id, created_at, id);
+
+-- Serves stream_ai_analyses pages (WHERE bot_id AND user_id [AND analysis_type]
+-- ORDER BY created_at DESC) without sorting the bot's analysis history
+CREATE INDEX IF NOT EXISTS idx_ai_analyses_bot_user_created_at
+    ON ai_analyses(bot_id, user_id, created_at DESC) WHERE bot_id IS NOT NULL;
@@ -0,0 +1,30 @@
+-- NusaNexus NoFOMO Trade Insert Function
+-- Migration: 014_record_trade_function
+-- Created: 2025-11-14
+-- Description: Single-function insert path for the per-fill trade write
+
+-- =============================================================================
+-- TRADE FUNCTIONS
+-- =============================================================================
+
+-- Insert one trade from a JSON object. Columns the caller omits keep their
+-- table defaults. Runs with the caller's privileges, so RLS applies exactly as
+-- for a direct insert; the plan for the body is cached per session.
+-- Returns the inserted row (as a set, so PostgREST always answers with an array).
+CREATE OR REPLACE FUNCTION record_trade(p_trade JSONB)
+RETURNS SETOF trades AS $$
+    INSERT INTO trades (
+        bot_id, user_id, exchange, trading_pair, side, order_type, amount, price,
+        fee, profit, profit_percentage, status, entry_time, exit_time, holding_duration,
+        exchange_order_id, exchange_trade_id, is_paper_trade, signal_price,
+        stop_loss_price, take_profit_price, metadata
+    )
+    SELECT
+        r.bot_id, r.user_id, r.exchange, r.trading_pair, r.side, r.order_type, r.amount, r.price,
+        COALESCE(r.fee, 0), COALESCE(r.profit, 0), COALESCE(r.profit_percentage, 0),
+        COALESCE(r.status, 'open'), r.entry_time, r.exit_time, r.holding_duration,
+        r.exchange_order_id, r.exchange_trade_id, COALESCE(r.is_paper_trade, true), r.signal_price,
+        r.stop_loss_price, r.take_profit_price, COALESCE(r.metadata, '{}')
+    FROM jsonb_populate_record(NULL::trades, p_trade) r
+    RETURNING *;
+$$ LANGUAGE sql;
@@ -0,0 +1,100 @@
+"""
+Tests for local access-token verification in get_current_user
+"""
+
+import asyncio
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core import auth
+from app.core.cache import TTLCache
+
+SECRET = "test-jwt-secret"
+
+
+@pytest.fixture(autouse=True)
+def fresh_auth_state(monkeypatch):
+    monkeypatch.setattr(auth, "_user_cache", TTLCache(ttl=auth.USER_CACHE_TTL, maxsize=100))
+    monkeypatch.setattr(auth, "_jwks", {})
+    monkeypatch.setattr(auth.settings, "supabase_jwt_secret", SECRET)
+
+
+def _claims(**overrides):
+    claims = {
+        "sub": "user-1",
+        "email": "trader@example.com",
+        "aud": "authenticated",
+        "exp": int(time.time()) + 3600,
+    }
+    claims.update(overrides)
+    return claims
+
+
+def _authenticate(token: str):
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    return asyncio.run(auth.get_current_user(credentials))
+
+
+def test_hs256_token_is_verified_with_the_project_secret():
+    token = jwt.encode(_claims(user_metadata={"full_name": "Ada Trader"}), SECRET, algorithm="HS256")
+    user = _authenticate(token)
+    assert user.id == "user-1"
+    assert user.email == "trader@example.com"
+    assert user.full_name == "Ada Trader"
+
+
+def test_missing_full_name_falls_back_to_email():
+    token = jwt.encode(_claims(), SECRET, algorithm="HS256")
+    assert _authenticate(token).full_name == "trader@example.com"
+
+
+def test_asymmetric_token_is_verified_with_the_jwks_key(monkeypatch):
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    refreshed = []
+
+    async def fake_refresh():
+        refreshed.append(True)
+        auth._jwks["key-1"] = private_key.public_key()
+
+    monkeypatch.setattr(auth, "_refresh_jwks", fake_refresh)
+    token = jwt.encode(_claims(), private_key, algorithm="ES256", headers={"kid": "key-1"})
+
+    assert _authenticate(token).id == "user-1"
+    # The unknown kid triggered one refresh; the key is then served from the local set
+    assert refreshed == [True]
+
+
+def test_token_signed_with_another_key_is_rejected():
+    token = jwt.encode(_claims(), "some-other-secret", algorithm="HS256")
+    with pytest.raises(HTTPException) as exc_info:
+        _authenticate(token)
+    assert exc_info.value.status_code == 401
+
+
+def test_wrong_audience_is_rejected():
+    token = jwt.encode(_claims(aud="anon"), SECRET, algorithm="HS256")
+    with pytest.raises(HTTPException) as exc_info:
+        _authenticate(token)
+    assert exc_info.value.status_code == 401
+
+
+def test_expired_token_is_rejected():
+    token = jwt.encode(_claims(exp=int(time.time()) - 10), SECRET, algorithm="HS256")
+    with pytest.raises(HTTPException) as exc_info:
+        _authenticate(token)
+    assert exc_info.value.status_code == 401
+
+
+def test_cached_user_does_not_outlive_the_token():
+    exp = int(time.time()) + 5
+    token = jwt.encode(_claims(exp=exp), SECRET, algorithm="HS256")
+    _authenticate(token)
+
+    expires_at, _ = auth._user_cache._data[auth._token_key(token)]
+    assert expires_at - time.monotonic() <= exp - time.time() + 0.1
+    assert expires_at - time.monotonic() < auth.USER_CACHE_TTL
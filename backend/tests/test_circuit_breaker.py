@@ -0,0 +1,63 @@
+"""
+Tests for the circuit breaker
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+def _open_breaker(reset_timeout: float = 0.01) -> CircuitBreaker:
+    breaker = CircuitBreaker(fail_max=1, reset_timeout=reset_timeout)
+    with breaker.guard():
+        breaker.record_failure()
+    assert breaker.is_open
+    return breaker
+
+
+def test_open_breaker_fails_fast():
+    breaker = _open_breaker(reset_timeout=60)
+    with pytest.raises(CircuitOpenError):
+        with breaker.guard():
+            pass
+
+
+def test_successful_probe_closes_breaker():
+    breaker = _open_breaker()
+    asyncio.run(asyncio.sleep(0.02))
+    with breaker.guard():
+        breaker.record_success()
+    assert not breaker.is_open
+
+
+def test_cancelled_probe_releases_the_probe_slot():
+    breaker = _open_breaker()
+
+    async def probe(started: asyncio.Event):
+        with breaker.guard():
+            started.set()
+            await asyncio.sleep(10)
+            breaker.record_success()
+
+    async def run():
+        await asyncio.sleep(0.02)
+        started = asyncio.Event()
+        task = asyncio.create_task(probe(started))
+        await started.wait()
+        # Other callers fail fast while the probe is in flight
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert breaker.is_open
+
+    # Once reset_timeout passes again, a new probe goes through and can close the breaker
+    asyncio.run(asyncio.sleep(0.02))
+    with breaker.guard():
+        breaker.record_success()
+    assert not breaker.is_open